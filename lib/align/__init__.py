@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """ Package for handling alignments files, detected faces and aligned faces along with their
 associated objects. """
-from .aligned_face import (AlignedFace, get_adjusted_center, get_matrix_scaling,
-                           get_centered_size, transform_image)
+from .aligned_face import (AlignedFace, get_adjusted_center, get_legacy_matrices,
+                           get_matrix_scaling, get_centered_size, transform_image)
 from .aligned_mask import BlurMask, LandmarksMask, Mask
 from .alignments import Alignments
 from .constants import CenteringType, EXTRACT_RATIOS, LANDMARK_PARTS, LandmarkType
@@ -46,6 +46,33 @@ def get_matrix_scaling(matrix: np.ndarray) -> tuple[int, int]:
     return interpolators
 
 
+def get_legacy_matrices(landmarks: np.ndarray) -> np.ndarray:
+    """ Calculate the default (legacy) alignment matrices for a batch of faces in a single pass.
+
+    The returned matrices are identical to those that :class:`AlignedFace` calculates for each
+    individual face, so can be passed in to :class:`AlignedFace` to skip the per face Umeyama
+    calculation.
+
+    Parameters
+    ----------
+    landmarks: :class:`numpy.ndarray`
+        The (`N`, `points`, 2) frame landmarks for a batch of faces. All faces in the batch must
+        have the same landmark type
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The (`N`, 2, 3) legacy transformation matrices for each face in the batch
+    """
+    landmark_type = LandmarkType.from_shape(landmarks.shape[1:])
+    lookup = LandmarkType.LM_2D_51 if landmark_type == LandmarkType.LM_2D_68 else landmark_type
+    if landmark_type == LandmarkType.LM_2D_68:
+        landmarks = landmarks[:, 17:]  # 68 point landmarks only use core face items
+    retval = _umeyama_batch(landmarks, _MEAN_FACE[lookup])[:, 0:2]
+    logger.trace("Legacy matrices: %s", retval.shape)  # type:ignore[attr-defined]
+    return retval
+
+
 def transform_image(image: np.ndarray,
                     matrix: np.ndarray,
                     size: int,
@@ -272,6 +299,10 @@ class AlignedFace():
     is_legacy: bool, optional
         Only used if `is_aligned` is ``True``. ``True`` indicates that the aligned image being
         loaded is a legacy extracted face rather than a current head extracted face
+    matrix: :class:`numpy.ndarray`, optional
+        The pre-calculated default (legacy) matrix for the given landmarks, as returned from
+        :func:`get_legacy_matrices`. Pass ``None`` to calculate the matrix from the landmarks.
+        Default: ``None``
     """
     def __init__(self,
                  landmarks: np.ndarray,
@@ -281,8 +312,10 @@ class AlignedFace():
                  coverage_ratio: float = 1.0,
                  dtype: str | None = None,
                  is_aligned: bool = False,
-                 is_legacy: bool = False) -> None:
-        logger.trace(parse_class_init(locals()))  # type:ignore[attr-defined]
+                 is_legacy: bool = False,
+                 matrix: np.ndarray | None = None) -> None:
+        if logger.isEnabledFor(5):  # Don't format the init parameters unless trace logging
+            logger.trace(parse_class_init(locals()))  # type:ignore[attr-defined]
         self._frame_landmarks = landmarks
         self._landmark_type = LandmarkType.from_shape(landmarks.shape)
         self._centering = centering
@@ -297,7 +330,8 @@ class AlignedFace():
         self._mean_lookup = LandmarkType.LM_2D_51 if lookup == LandmarkType.LM_2D_68 else lookup
 
         self._cache = _FaceCache()
-        self._matrices: dict[CenteringType, np.ndarray] = {"legacy": self._get_default_matrix()}
+        self._matrices: dict[CenteringType, np.ndarray] = {
+            "legacy": self._get_default_matrix() if matrix is None else matrix}
 
         self._face = self.extract_face(image)
         logger.trace("Initialized: %s (padding: %s, face shape: %s)",  # type:ignore[attr-defined]
@@ -753,3 +787,56 @@ def _umeyama(source: np.ndarray, destination: np.ndarray, estimate_scale: bool)
     retval[:dim, :dim] *= scale
 
     return retval
+
+
+def _umeyama_batch(source: np.ndarray, destination: np.ndarray) -> np.ndarray:
+    """ Estimate the similarity transformation, with scaling, for a batch of source coordinates
+    to a single set of destination coordinates.
+
+    This is a vectorized version of :func:`_umeyama` with `estimate_scale` set to ``True``.
+    Rank deficient items within the batch are rare, so they are passed to :func:`_umeyama`
+    individually.
+
+    Parameters
+    ----------
+    source: :class:`numpy.ndarray`
+        (B, M, N) array of source coordinates.
+    destination: :class:`numpy.ndarray`
+        (M, N) array destination coordinates.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        (B, N + 1, N + 1) The homogeneous similarity transformation matrices
+    """
+    # pylint:disable=invalid-name
+    num = source.shape[1]
+    dim = source.shape[2]
+
+    src_mean = source.mean(axis=1)
+    dst_mean = destination.mean(axis=0)
+
+    src_demean = source - src_mean[:, None]
+    dst_demean = destination - dst_mean
+
+    A = dst_demean.T @ src_demean / num
+
+    d = np.ones((source.shape[0], dim), dtype=np.double)
+    d[np.linalg.det(A) < 0, dim - 1] = -1
+
+    retval = np.tile(np.eye(dim + 1, dtype=np.double), (source.shape[0], 1, 1))
+
+    U, S, V = np.linalg.svd(A)
+    retval[:, :dim, :dim] = (U * d[:, None]) @ V
+
+    with np.errstate(divide="ignore", invalid="ignore"):  # Rank deficient items are replaced
+        scale = 1.0 / src_demean.var(axis=1).sum(axis=1) * (S * d).sum(axis=1)
+
+    retval[:, :dim, dim] = dst_mean - scale[:, None] * (retval[:, :dim, :dim] @
+                                                        src_mean[..., None])[..., 0]
+    retval[:, :dim, :dim] *= scale[:, None, None]
+
+    for idx in np.flatnonzero(np.linalg.matrix_rank(A) != dim):
+        retval[idx] = _umeyama(source[idx], destination, True)
+
+    return retval
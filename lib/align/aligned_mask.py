@@ -362,6 +362,21 @@ class Mask():
         """
         return self.to_dict(is_png=True)
 
+    def copy(self) -> Mask:
+        """ Obtain a copy of this mask that can be edited independently of it.
+
+        The compressed mask is immutable, so it is shared with the copy rather than duplicated.
+
+        Returns
+        -------
+        :class:`Mask`
+            A copy of this mask
+        """
+        retval = self.__class__.__new__(self.__class__)
+        retval.__dict__.update(self.__dict__)
+        retval._sub_crop_slices = dict(self._sub_crop_slices)
+        return retval
+
     def from_dict(self, mask_dict: MaskAlignmentsFileDict) -> None:
         """ Populates the :class:`Mask` from a dictionary loaded from an alignments file.
 
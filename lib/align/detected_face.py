@@ -170,6 +170,30 @@ class DetectedFace():
         fsmask.add(mask, affine_matrix, interpolator)
         self.mask[name] = fsmask
 
+    def clone(self) -> DetectedFace:
+        """ Obtain a copy of this detected face that can be edited independently of it.
+
+        This is much faster than :func:`copy.deepcopy`. The aligned face is not copied, so
+        :func:`load_aligned` should be called on the returned face if it is required.
+
+        Returns
+        -------
+        :class:`DetectedFace`
+            A copy of this detected face
+        """
+        retval = DetectedFace(
+            image=None if self.image is None else self.image.copy(),
+            left=self.left,
+            width=self.width,
+            top=self.top,
+            height=self.height,
+            landmarks_xy=None if self._landmarks_xy is None else self._landmarks_xy.copy(),
+            mask={name: mask.copy() for name, mask in self.mask.items()})
+        retval._identity = {name: embedding.copy() for name, embedding in self._identity.items()}
+        retval.thumbnail = None if self.thumbnail is None else self.thumbnail.copy()
+        retval._training_masks = self._training_masks
+        return retval
+
     def add_landmarks_xy(self, landmarks: np.ndarray) -> None:
         """ Add landmarks to the detected face object. If landmarks alread exist, they will be
         overwritten.
@@ -312,7 +336,7 @@ class DetectedFace():
                                       w=self.width,
                                       y=self.top,
                                       h=self.height,
-                                      landmarks_xy=self.landmarks_xy,
+                                      landmarks_xy=self.landmarks_xy.copy(),
                                       mask={name: mask.to_dict()
                                             for name, mask in self.mask.items()},
                                       identity={k: v.tolist() for k, v in self._identity.items()},
@@ -433,7 +457,8 @@ class DetectedFace():
                      coverage_ratio: float = 1.0,
                      force: bool = False,
                      is_aligned: bool = False,
-                     is_legacy: bool = False) -> None:
+                     is_legacy: bool = False,
+                     matrix: np.ndarray | None = None) -> None:
         """ Align a face from a given image.
 
         Aligning a face is a relatively expensive task and is not required for all uses of
@@ -471,6 +496,10 @@ class DetectedFace():
         is_legacy: bool, optional
             Only used if `is_aligned` is ``True``. ``True`` indicates that the aligned image being
             loaded is a legacy extracted face rather than a current head extracted face
+        matrix: :class:`numpy.ndarray`, optional
+            The pre-calculated default (legacy) matrix for this face's landmarks, as returned from
+            :func:`lib.align.get_legacy_matrices`. Pass ``None`` to calculate the matrix from the
+            landmarks. Default: ``None``
         Notes
         -----
         This method must be executed to get access to the following an :class:`AlignedFace` object
@@ -489,7 +518,8 @@ class DetectedFace():
                                         coverage_ratio=coverage_ratio,
                                         dtype=dtype,
                                         is_aligned=is_aligned,
-                                        is_legacy=is_aligned and is_legacy)
+                                        is_legacy=is_aligned and is_legacy,
+                                        matrix=matrix)
 
 
 _HASHES_SEEN: dict[str, dict[str, int]] = {}
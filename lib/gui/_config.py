@@ -5,7 +5,6 @@ import logging
 import sys
 import os
 from tkinter import font as tk_font
-from matplotlib import font_manager
 
 from lib.config import FaceswapConfig
 
@@ -101,9 +100,11 @@ def get_clean_fonts():
     list:
         A list of valid fonts for the system
     """
-    fmanager = font_manager.FontManager()
+    # matplotlib is only needed here, so keep it out of the GUI's import time. Use the shared font
+    # manager, which is loaded from matplotlib's font cache, rather than rescanning system fonts
+    from matplotlib import font_manager  # pylint:disable=import-outside-toplevel
     fonts = {}
-    for font in fmanager.ttflist:
+    for font in font_manager.fontManager.ttflist:
         if str(font.weight) in ("400", "normal", "regular"):
             fonts.setdefault(font.name, {})["regular"] = True
         if str(font.weight) in ("700", "bold"):
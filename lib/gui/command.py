@@ -70,21 +70,19 @@ class CommandNotebook(ttk.Notebook):  # pylint:disable=too-many-ancestors
     def change_action_button(self, *args):
         """ Change the action button to relevant control """
         logger.debug("Update Action Buttons: (args: %s", args)
-        tk_vars = get_config().tk_vars
+        is_running = get_config().tk_vars.running_task.get()
+        img = get_images().icons["stop" if is_running else "start"]
 
-        for cmd, action in self.actionbtns.items():
-            btnact = action
-            if tk_vars.running_task.get():
+        for cmd, (btnact, tooltip) in self.actionbtns.items():
+            if is_running:
                 ttl = " Stop"
-                img = get_images().icons["stop"]
                 hlp = "Exit the running process"
             else:
                 ttl = f" {cmd.title()}"
-                img = get_images().icons["start"]
                 hlp = f"Run the {cmd.title()} script"
             logger.debug("Updated Action Button: '%s'", ttl)
             btnact.config(text=ttl, image=img)
-            Tooltip(btnact, text=hlp, wrap_length=200)
+            tooltip.text = hlp
 
     def _set_modified_vars(self):
         """ Set the tkinter variable for each tab to indicate whether contents
@@ -192,9 +190,9 @@ class ActionFrame(ttk.Frame):  # pylint:disable=too-many-ancestors
                             width=14,
                             command=lambda: tk_vars.action_command.set(var_value))
         btnact.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        Tooltip(btnact,
-                text=_("Run the {} script").format(self.title),
-                wrap_length=200)
-        actionbtns[self.command] = btnact
+        tooltip = Tooltip(btnact,
+                          text=_("Run the {} script").format(self.title),
+                          wrap_length=200)
+        actionbtns[self.command] = (btnact, tooltip)
 
         logger.debug("Added action buttons: '%s'", self.title)
@@ -167,6 +167,7 @@ class ControlPanelOption():
                          "rounding": rounding,
                          "min_max": min_max,
                          "helptext": helptext}
+        self._formatted_helptext: str | None = None
         self.control = self.get_control()
         self.tk_var = self.get_tk_var(initial_value, track_modified)
         logger.debug("Initialized %s", self.__class__.__name__)
@@ -233,10 +234,11 @@ class ControlPanelOption():
 
     @property
     def helptext(self):
-        """ Format and return help text for tooltips """
+        """ Format and return help text for tooltips. The formatted text is cached on first
+        access. """
         helptext = self._options["helptext"]
-        if helptext is None:
-            return helptext
+        if helptext is None or self._formatted_helptext is not None:
+            return self._formatted_helptext
         logger.debug("Format control help: '%s'", self.name)
         if helptext.startswith("R|"):
             helptext = helptext[2:].replace("\nL|", "\n - ").replace("\n", "\n\n")
@@ -244,6 +246,7 @@ class ControlPanelOption():
             helptext = helptext.replace("\n\t", "\n - ").replace("%%", "%")
         helptext = self.title + " - " + helptext
         logger.debug("Formatted control help: (name: '%s', help: '%s'", self.name, helptext)
+        self._formatted_helptext = helptext
         return helptext
 
     def get(self):
@@ -422,6 +425,7 @@ class ControlPanel(ttk.Frame):  # pylint:disable=too-many-ancestors
 
         self.group_frames = {}
         self._sub_group_frames = {}
+        self._scroll_update_id = None
 
         canvas_kwargs = {"bd": 0, "highlightthickness": 0, "bg": self._theme["panel_background"]}
 
@@ -544,7 +548,17 @@ class ControlPanel(ttk.Frame):  # pylint:disable=too-many-ancestors
         logger.debug("Added Config Scrollbar")
 
     def update_scrollbar(self, event):  # pylint:disable=unused-argument
-        """ Update the options frame scrollbar """
+        """ Update the options frame scrollbar.
+
+        Configure events arrive in bursts whilst the window is resized or the panel is built, so
+        the scroll region is recalculated once when the GUI is next idle. """
+        if self._scroll_update_id is not None:
+            self.after_cancel(self._scroll_update_id)
+        self._scroll_update_id = self.after_idle(self._set_scroll_region)
+
+    def _set_scroll_region(self):
+        """ Set the canvas scroll region to the bounding box of the options frame """
+        self._scroll_update_id = None
         self._canvas.configure(scrollregion=self._canvas.bbox("all"))
 
     def resize_frame(self, event):
@@ -977,17 +991,9 @@ class ControlBuilder():
     def build_one_control(self):
         """ Build and place the option controls """
         logger.debug("Build control: '%s')", self.option.name)
-        if self.option.control == "scale":
-            ctl = self.slider_control()
-        elif self.option.control in ("radio", "multi"):
-            ctl = self._multi_option_control(self.option.control)
-        elif self.option.control == "colorchooser":
-            ctl = self._color_control()
-        elif self.option.control == ttk.Checkbutton:
-            ctl = self.control_to_checkframe()
-        else:
-            ctl = self.control_to_optionsframe()
-        if self.option.control != ttk.Checkbutton:
+        control = self.option.control
+        ctl = self._builders.get(control, ControlBuilder.control_to_optionsframe)(self)
+        if control != ttk.Checkbutton:  # Check buttons are placed in their own frame
             ctl.pack(padx=5, pady=5, fill=tk.X, expand=True)
             if self.option.helptext is not None and not self.helpset:
                 tooltip_kwargs = {"text": self.option.helptext}
@@ -997,16 +1003,11 @@ class ControlBuilder():
 
         logger.debug("Built control: '%s'", self.option.name)
 
-    def _multi_option_control(self, option_type):
-        """ Create a group of buttons for single or multi-select
-
-        Parameters
-        ----------
-        option_type: {"radio", "multi"}
-            The type of boxes that this control should hold. "radio" for single item select,
-            "multi" for multi item select.
-
-        """
+    def _multi_option_control(self):
+        """ Create a group of buttons for single or multi-select. The type of boxes that the
+        control holds is taken from the option's control type: "radio" for single item select,
+        "multi" for multi item select. """
+        option_type = self.option.control
         logger.debug("Adding %s group: %s", option_type, self.option.name)
         help_intro, help_items = self._get_multi_help_items(self.option.helptext)
         ctl = ttk.LabelFrame(self.frame,
@@ -1226,6 +1227,14 @@ class ControlBuilder():
         logger.debug("Added control checkframe: '%s'", self.option.name)
         return ctl
 
+    # Builders for each control type, built once. Combobox and Entry controls fall through to
+    # control_to_optionsframe
+    _builders = {"scale": slider_control,
+                 "radio": _multi_option_control,
+                 "multi": _multi_option_control,
+                 "colorchooser": _color_control,
+                 ttk.Checkbutton: control_to_checkframe}
+
 
 class FileBrowser():
     """ Add FileBrowser buttons to control and handle routing """
@@ -1276,6 +1285,14 @@ class FileBrowser():
         frame = ttk.Frame(self.frame, style=f"{self._style}Group.TFrame")
         frame.pack(side=tk.RIGHT, padx=(0, 5))
 
+        icons = get_images().icons
+        actions = {"folder": self.ask_folder,
+                   "load": self.ask_load,
+                   "multi_load": self.ask_multi_load,
+                   "save": self.ask_save,
+                   "nothing": self.ask_nothing,
+                   "context": self.ask_context}
+        bg_color = get_config().user_theme["group_panel"]["button_background"]
         for browser in self.browser:
             if browser == "save":
                 lbl = "save_as"
@@ -1290,15 +1307,15 @@ class FileBrowser():
                 lbl = "model"
             else:
                 lbl = browser
-            img = get_images().icons[lbl]
-            action = getattr(self, "ask_" + browser)
+            img = icons[lbl]
+            action = actions[browser]
             cmd = partial(action, filepath=self.tk_var, filetypes=self.filetypes)
             fileopn = tk.Button(frame,
                                 image=img,
                                 command=cmd,
                                 relief=tk.SOLID,
                                 bd=1,
-                                bg=get_config().user_theme["group_panel"]["button_background"],
+                                bg=bg_color,
                                 cursor="hand2")
             _add_command(fileopn.cget("command"), cmd)
             fileopn.pack(padx=1, side=tk.RIGHT)
@@ -7,6 +7,7 @@ import re
 import sys
 import typing as T
 import tkinter as tk
+from collections import deque
 from tkinter import ttk, TclError
 
 import numpy as np
@@ -133,6 +134,8 @@ class ConsoleOut(ttk.Frame):  # pylint:disable=too-many-ancestors
     debug: bool
         ``True`` if console output should not be directed to this widget otherwise ``False``
     """
+    _refresh_interval = 33
+    """ int: The number of milliseconds between writing pending output to the console """
 
     def __init__(self, parent, debug):
         logger.debug("Initializing %s: (parent: %s, debug: %s)",
@@ -145,6 +148,8 @@ class ConsoleOut(ttk.Frame):  # pylint:disable=too-many-ancestors
         self._console_clear = get_config().tk_vars.console_clear
         self._set_console_clear_var_trace()
         self._debug = debug
+        self._queue: deque[tuple[str, str]] = deque()
+        self._after_id: str | None = None
         self._build_console()
         self._add_tags()
         self.pack(side=tk.TOP, anchor=tk.W, padx=10, pady=(2, 0),
@@ -191,20 +196,40 @@ class ConsoleOut(ttk.Frame):  # pylint:disable=too-many-ancestors
         if self._debug:
             logger.info("Console debug activated. Outputting to main terminal")
         else:
-            sys.stdout = _SysOutRouter(self._console, "stdout")
-            sys.stderr = _SysOutRouter(self._console, "stderr")
+            sys.stdout = _SysOutRouter(self._queue, "stdout")
+            sys.stderr = _SysOutRouter(self._queue, "stderr")
+            self._after_id = self.after(self._refresh_interval, self._write_queued)
         logger.debug("Redirected console")
 
+    def _write_queued(self):
+        """ Write all output that has been queued since the last refresh into the console in a
+        single insert, then reschedule. """
+        args = []
+        for _ in range(len(self._queue)):
+            args.extend(self._queue.popleft())
+        if args:
+            self._console.insert(tk.END, *args)
+            self._console.see(tk.END)
+        self._after_id = self.after(self._refresh_interval, self._write_queued)
+
     def _clear(self, *args):  # pylint:disable=unused-argument
         """ Clear the console output screen """
         logger.debug("Clear console")
         if not self._console_clear.get():
             logger.debug("Console not set for clearing. Skipping")
             return
+        self._queue.clear()
         self._console.delete(1.0, tk.END)
         self._console_clear.set(False)
         logger.debug("Cleared console")
 
+    def destroy(self):
+        """ Cancel the scheduled console refresh prior to destroying the widget """
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
+
 
 class _ReadOnlyText(tk.Text):  # pylint:disable=too-many-ancestors
     """ A read only text widget.
@@ -223,20 +248,23 @@ class _ReadOnlyText(tk.Text):  # pylint:disable=too-many-ancestors
 
 
 class _SysOutRouter():
-    """ Route stdout/stderr to the given text box.
+    """ Route stdout/stderr to the console.
+
+    Output is not written to the text box directly. Each line is tagged and placed in a queue
+    which the :class:`ConsoleOut` widget empties into the text box at a fixed interval.
 
     Parameters
     ----------
-    console: tkinter Object
-        The widget that will receive the output from stderr/stdout
+    queue: :class:`collections.deque`
+        The queue that receives (text, tag) pairs from stderr/stdout
     out_type: ['stdout', 'stderr']
         The output type to redirect
     """
 
-    def __init__(self, console, out_type):
-        logger.debug("Initializing %s: (console: %s, out_type: '%s')",
-                     self.__class__.__name__, console, out_type)
-        self._console = console
+    def __init__(self, queue, out_type):
+        logger.debug("Initializing %s: (queue: %s, out_type: '%s')",
+                     self.__class__.__name__, queue, out_type)
+        self._queue = queue
         self._out_type = out_type
         self._recolor = re.compile(r".+?(\s\d+:\d+:\d+\s)(?P<lvl>[A-Z]+)\s")
         self._ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -255,10 +283,14 @@ class _SysOutRouter():
         return tag
 
     def write(self, string):
-        """ Capture stdout/stderr """
+        """ Capture stdout/stderr.
+
+        The subprocess readers can send a block of several lines in one write, so each line is
+        tagged individually.
+        """
         string = self._ansi_escape.sub("", string)
-        self._console.insert(tk.END, string, self._get_tag(string))
-        self._console.see(tk.END)
+        for line in string.splitlines(keepends=True):
+            self._queue.append((line, self._get_tag(line)))
 
     @staticmethod
     def flush():
@@ -613,6 +645,17 @@ class Tooltip:  # pylint:disable=too-few-public-methods
         self._ident = None
         self._topwidget = None
 
+    @property
+    def text(self):
+        """ str: The text displayed in the tool-tip. Setting this updates the text shown on the
+        next hover without re-binding the widget's events. """
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        """ Update the text to display in the tool-tip. """
+        self._text = value
+
     def _on_enter(self, event=None):  # pylint:disable=unused-argument
         """ Schedule on an enter event """
         self._schedule()
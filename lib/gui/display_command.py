@@ -12,7 +12,6 @@ from tkinter import ttk
 from lib.logger import parse_class_init
 from lib.training.preview_tk import PreviewTk
 
-from .display_graph import TrainingGraph
 from .display_page import DisplayOptionalPage
 from .custom_widgets import Tooltip
 from .analysis import Calculations, Session
@@ -345,6 +344,9 @@ class GraphDisplay(DisplayOptionalPage):  # pylint:disable=too-many-ancestors
 
     def display_item_process(self) -> None:
         """ Add a single graph to the graph window """
+        if not self._tab_is_active:
+            logger.debug("Graph tab not active. Deferring graph creation")
+            return
         if not Session.is_training:
             logger.debug("Waiting for Session Data to become available to graph")
             self.after(1000, self.display_item_process)
@@ -426,6 +428,8 @@ class GraphDisplay(DisplayOptionalPage):  # pylint:disable=too-many-ancestors
         data: :class:`~lib.gui.analysis.stats.Calculations`
             The object holding the data to be graphed
         """
+        # matplotlib is only imported once a graph is actually displayed
+        from .display_graph import TrainingGraph  # pylint:disable=import-outside-toplevel
         logger.debug("Adding child: %s", name)
         graph = TrainingGraph(self.subnotebook, data, "Loss")
         graph.build()
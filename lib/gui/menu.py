@@ -561,6 +561,7 @@ class TaskBar(ttk.Frame):  # pylint:disable=too-many-ancestors
         """ Place the project buttons """
         frame = ttk.Frame(self._btn_frame)
         frame.pack(side=tk.LEFT, anchor=tk.W, expand=False, padx=2)
+        icons = get_images().icons
 
         for btntype in ("new", "load", "save", "save_as", "reload"):
             logger.debug("Adding button: '%s'", btntype)
@@ -568,7 +569,7 @@ class TaskBar(ttk.Frame):  # pylint:disable=too-many-ancestors
             loader, kwargs = self._loader_and_kwargs(btntype)
             cmd = getattr(self._config.project, loader)
             btn = ttk.Button(frame,
-                             image=get_images().icons[btntype],
+                             image=icons[btntype],
                              command=lambda fn=cmd, kw=kwargs: fn(**kw))  # type:ignore
             btn.pack(side=tk.LEFT, anchor=tk.W)
             hlp = self._set_help(btntype)
@@ -578,6 +579,7 @@ class TaskBar(ttk.Frame):  # pylint:disable=too-many-ancestors
         """ Place the task buttons """
         frame = ttk.Frame(self._btn_frame)
         frame.pack(side=tk.LEFT, anchor=tk.W, expand=False, padx=2)
+        icons = get_images().icons
 
         for loadtype in ("load", "save", "save_as", "clear", "reload"):
             btntype = f"{loadtype}2"
@@ -589,7 +591,7 @@ class TaskBar(ttk.Frame):  # pylint:disable=too-many-ancestors
             cmd = getattr(self._config.tasks, loader)
             btn = ttk.Button(
                 frame,
-                image=get_images().icons[btntype],
+                image=icons[btntype],
                 command=lambda fn=cmd, kw=kwargs: fn(**kw))  # type:ignore
             btn.pack(side=tk.LEFT, anchor=tk.W)
             hlp = self._set_help(btntype)
@@ -600,13 +602,14 @@ class TaskBar(ttk.Frame):  # pylint:disable=too-many-ancestors
         # pylint:disable=cell-var-from-loop
         frame = ttk.Frame(self._btn_frame)
         frame.pack(side=tk.LEFT, anchor=tk.W, expand=False, padx=2)
+        icons = get_images().icons
         for name in ("extract", "train", "convert"):
             btntype = f"settings_{name}"
-            btntype = btntype if btntype in get_images().icons else "settings"
+            btntype = btntype if btntype in icons else "settings"
             logger.debug("Adding button: '%s'", btntype)
             btn = ttk.Button(
                 frame,
-                image=get_images().icons[btntype],
+                image=icons[btntype],
                 command=lambda n=name: open_popup(name=n))  # type:ignore
             btn.pack(side=tk.LEFT, anchor=tk.W)
             hlp = _("Configure {} settings...").format(name.title())
@@ -57,6 +57,8 @@ class CliOptions():
         self._commands: dict[T.Literal["faceswap", "tools"], list[str]] = {"faceswap": [],
                                                                            "tools": []}
         self._opts: dict[str, dict[str, CliOption | str]] = {}
+        self._command_opts: dict[str, list[CliOption]] = {}
+        self._all_opts: list[CliOption] = []
         self._build_options()
         logger.debug("Initialized %s", self.__class__.__name__)
 
@@ -327,26 +329,25 @@ class CliOptions():
     @classmethod
     def _expand_action_option(cls,
                               option: dict[str, T.Any],
-                              options: list[dict[str, T.Any]]) -> None:
+                              full_opts: dict[str, str]) -> None:
         """ Expand the action option to the full command name
 
         Parameters
         ----------
         option: dict[str, Any]
             The option to expand the action for
-        options: list[dict[str, Any]]
-            The full list of options for the command
+        full_opts: dict[str, str]
+            The first command line flag mapped to the full command line flag for each option in
+            the command
         """
-        opts = {opt["opts"][0]: opt["opts"][-1]
-                for opt in options}
         old_val = option["action_option"]
-        new_val = opts[old_val]
+        new_val = full_opts[old_val]
         logger.debug("Updating action option from '%s' to '%s'", old_val, new_val)
         option["action_option"] = new_val
 
     def _get_sysbrowser(self,
                         option: dict[str, T.Any],
-                        options: list[dict[str, T.Any]],
+                        full_opts: dict[str, str],
                         command: str) -> dict[T.Literal["filetypes",
                                                         "browser",
                                                         "command",
@@ -358,8 +359,9 @@ class CliOptions():
         ----------
         option: dict[str, Any]
             The option to obtain the system browser for
-        options: list[dict[str, Any]]
-            The full list of options for the command
+        full_opts: dict[str, str]
+            The first command line flag mapped to the full command line flag for each option in
+            the command
         command: str
             The command that the options belong to
 
@@ -386,7 +388,7 @@ class CliOptions():
                                "action_option"], str | list[str]] = {}
         action_option = None
         if option.get("action_option", None) is not None:
-            self._expand_action_option(option, options)
+            self._expand_action_option(option, full_opts)
             action_option = option["action_option"]
         retval["filetypes"] = option.get("filetypes", "default")
         if action == actions.FileFullPaths:
@@ -426,23 +428,25 @@ class CliOptions():
             The collected command line options for handling by the GUI
         """
         retval: dict[str, CliOption] = {}
+        full_opts = {opt["opts"][0]: opt["opts"][-1] for opt in command_options}
         for opt in command_options:
             logger.debug("Processing: cli option: %s", opt["opts"])
             if opt.get("help", "") == SUPPRESS:
                 logger.debug("Skipping suppressed option: %s", opt)
                 continue
             title = self._set_control_title(opt["opts"])
+            action = opt.get("action", "")
             cpanel_option = ControlPanelOption(
                 title,
                 self._get_data_type(opt),
                 group=opt.get("group", None),
                 default=opt.get("default", None),
                 choices=opt.get("choices", None),
-                is_radio=opt.get("action", "") == actions.Radio,
-                is_multi_option=opt.get("action", "") == actions.MultiOption,
+                is_radio=action == actions.Radio,
+                is_multi_option=action == actions.MultiOption,
                 rounding=self._get_rounding(opt),
                 min_max=opt.get("min_max", None),
-                sysbrowser=self._get_sysbrowser(opt, command_options, command),
+                sysbrowser=self._get_sysbrowser(opt, full_opts, command),
                 helptext=opt["help"],
                 track_modified=True,
                 command=command)
@@ -480,27 +484,9 @@ class CliOptions():
             self._store_commands(category, classes)
             self._extract_options(classes)
             logger.debug("Built '%s'", category)
-
-    def _gen_command_options(self, command: str
-                             ) -> T.Generator[tuple[str, CliOption], None, None]:
-        """ Yield each option for specified command
-
-        Parameters
-        ----------
-        command: str
-            The faceswap command to generate the options for
-
-        Yields
-        ------
-        str
-            The option name for display
-        :class:`CliOption`:
-            The option object
-        """
-        for key, val in self._opts.get(command, {}).items():
-            if not isinstance(val, CliOption):
-                continue
-            yield key, val
+        self._command_opts = {command: [opt for opt in opts.values() if isinstance(opt, CliOption)]
+                              for command, opts in self._opts.items()}
+        self._all_opts = [opt for opts in self._command_opts.values() for opt in opts]
 
     def _options_to_process(self, command: str | None = None) -> list[CliOption]:
         """ Return a consistent object for processing regardless of whether processing all commands
@@ -517,9 +503,8 @@ class CliOptions():
             The options to be processed
         """
         if command is None:
-            return [opt for opts in self._opts.values()
-                    for opt in opts if isinstance(opt, CliOption)]
-        return [opt for opt in self._opts[command] if isinstance(opt, CliOption)]
+            return self._all_opts
+        return self._command_opts[command]
 
     def reset(self, command: str | None = None) -> None:
         """ Reset the options for all or passed command back to default value
@@ -550,9 +535,10 @@ class CliOptions():
         logger.debug("Clearing options. (command: '%s'", command)
         for option in self._options_to_process(command):
             cp_opt = option.cpanel_option
-            if isinstance(cp_opt.get(), bool):
+            # Dispatch on the option's data type rather than round-tripping its value from Tcl
+            if cp_opt.dtype == bool:
                 cp_opt.set(False)
-            elif isinstance(cp_opt.get(), (int, float)):
+            elif cp_opt.dtype in (int, float):
                 cp_opt.set(0)
             else:
                 cp_opt.set("")
@@ -601,10 +587,10 @@ class CliOptions():
         :class:`tkinter.Variable` | None
             The requested tkinter variable, or ``None`` if it could not be found
         """
-        for opt_title, option in self._gen_command_options(command):
-            if opt_title == title:
-                return option.cpanel_option.tk_var
-        return None
+        option = self._opts.get(command, {}).get(title)
+        if not isinstance(option, CliOption):
+            return None
+        return option.cpanel_option.tk_var
 
     def gen_cli_arguments(self, command: str) -> T.Generator[tuple[str, ...], None, None]:
         """ Yield the generated cli arguments for the selected command
@@ -620,16 +606,20 @@ class CliOptions():
             The generated command line arguments
         """
         output_dir = None
-        for _, option in self._gen_command_options(command):
+        batch_mode = False
+        has_preview = command in ("extract", "convert")
+        for option in self._command_opts.get(command, []):
             str_val = str(option.cpanel_option.get())
             switch = option.opts[0]
-            batch_mode = command == "extract" and switch == "-b"  # Check for batch mode
-            if command in ("extract", "convert") and switch == "-o":  # Output location for preview
+            if has_preview and switch == "-o":  # Output location for preview
                 output_dir = str_val
 
             if str_val in ("False", ""):  # skip no value opts
                 continue
 
+            if command == "extract" and switch == "-b":  # Check for batch mode
+                batch_mode = True
+
             if str_val == "True":  # store_true just output the switch
                 yield (switch, )
                 continue
@@ -644,6 +634,6 @@ class CliOptions():
                 retval = (switch, str_val)
             yield retval
 
-        if command in ("extract", "convert") and output_dir is not None:
+        if has_preview and output_dir is not None:
             get_images().preview_extract.set_faceswap_output_path(output_dir,
                                                                   batch_mode=batch_mode)
@@ -5,16 +5,19 @@ import csv
 import gettext
 import logging
 import tkinter as tk
+import typing as T
 
 from dataclasses import dataclass, field
 from tkinter import ttk
 
 from .control_helper import ControlBuilder, ControlPanelOption
 from .custom_widgets import Tooltip
-from .display_graph import SessionGraph
 from .analysis import Calculations, Session
 from .utils import FileHandler, get_images, LongRunningTask
 
+if T.TYPE_CHECKING:
+    from .display_graph import SessionGraph
+
 logger = logging.getLogger(__name__)
 
 # LOCALES
@@ -86,7 +89,7 @@ class SessionPopUp(tk.Toplevel):
         self._session_id = None if session_id == "Total" else int(session_id)
 
         self._graph_frame = ttk.Frame(self)
-        self._graph: SessionGraph | None = None
+        self._graph: "SessionGraph | None" = None
         self._display_data: Calculations | None = None
 
         self._vars = self._set_vars()
@@ -561,6 +564,8 @@ class SessionPopUp(tk.Toplevel):
         self._lbl_loading.pack_forget()
         self.update_idletasks()
         if self._graph is None:
+            # matplotlib is only imported once a graph is actually displayed
+            from .display_graph import SessionGraph  # pylint:disable=import-outside-toplevel
             graph = SessionGraph(self._graph_frame,
                                  self._display_data,
                                  self._vars.display.get(),
@@ -149,12 +149,10 @@ class _GuiSession():  # pylint:disable=too-few-public-methods
 
         if filename is None:
             logger.debug("Popping file handler")
-            cfgfile = self._file_handler("open", handler).return_file
-            if not cfgfile:
+            filename = self._file_handler("filename", handler).return_file
+            if not filename:
                 logger.debug("No filename given")
                 return False
-            filename = cfgfile.name
-            cfgfile.close()
 
         if not os.path.isfile(filename):
             msg = f"File does not exist: '{filename}'"
@@ -382,17 +380,16 @@ class _GuiSession():  # pylint:disable=too-few-public-methods
         """
         logger.debug("Popping save as file handler. session_type: '%s'", session_type)
         title = f"Save {f'{session_type.title()} ' if session_type != 'all' else ''}As..."
-        cfgfile = self._file_handler("save",
-                                     f"config_{session_type}",
-                                     title=title,
-                                     initial_folder=self._dirname).return_file
-        if not cfgfile:
+        filename = self._file_handler("save_filename",
+                                      f"config_{session_type}",
+                                      title=title,
+                                      initial_folder=self._dirname).return_file
+        if not filename:
             logger.debug("No filename provided. session_type: '%s'", session_type)
             return False
-        self._filename = cfgfile.name
+        self._filename = filename
         logger.debug("Set filename: (session_type: '%s', filename: '%s'",
                      session_type, self._filename)
-        cfgfile.close()
         return True
 
     def _save(self, command=None):
@@ -854,15 +851,14 @@ class Project(_GuiSession):
             logger.debug("Creating new project cancelled")
             return
 
-        cfgfile = self._file_handler("save",
-                                     "config_project",
-                                     title="New Project...",
-                                     initial_folder=self._basename).return_file
-        if not cfgfile:
+        filename = self._file_handler("save_filename",
+                                      "config_project",
+                                      title="New Project...",
+                                      initial_folder=self._basename).return_file
+        if not filename:
             logger.debug("No filename selected")
             return
-        self._filename = cfgfile.name
-        cfgfile.close()
+        self._filename = filename
 
         self.set_default_options()
         self._config.cli_opts.reset()
@@ -1,6 +1,8 @@
 #!/usr/bin python3
 """ Process wrapper for underlying faceswap commands for the GUI """
 from __future__ import annotations
+import errno
+import locale
 import os
 import logging
 import re
@@ -8,7 +10,8 @@ import signal
 import sys
 import typing as T
 
-from subprocess import PIPE, Popen
+from queue import Empty, SimpleQueue
+from subprocess import PIPE, Popen, TimeoutExpired
 from threading import Thread
 from time import time
 
@@ -22,6 +25,11 @@ if os.name == "nt":
 
 logger = logging.getLogger(__name__)
 
+_READ_SIZE = 65536
+""" int: The maximum number of bytes to read from a subprocess pipe in a single call """
+_GUI_UPDATE_INTERVAL = 33
+""" int: The number of milliseconds between processing GUI updates queued by the pipe readers """
+
 
 class ProcessWrapper():
     """ Builds command, launches and terminates the underlying
@@ -231,6 +239,10 @@ class FaceswapControl():
         self._command: str | None = None
         self._process: Popen | None = None
         self._thread: LongRunningTask | None = None
+        self._on_terminated: list[T.Callable[[], None]] = []
+        self._readers: list[Thread] = []
+        self._gui_queue: SimpleQueue[tuple[T.Callable[..., None], tuple]] = SimpleQueue()
+        self._gui_poll_id: str | None = None
         self._train_stats: dict[T.Literal["iterations", "timestamp"],
                                 int | float | None] = {"iterations": 0, "timestamp": None}
         self._consoleregex: dict[T.Literal["loss", "tqdm", "ffmpeg"], re.Pattern] = {
@@ -238,6 +250,7 @@ class FaceswapControl():
             "tqdm": re.compile(r"(?P<dsc>.*?)(?P<pct>\d+%).*?(?P<itm>\S+/\S+)\W\["
                                r"(?P<tme>[\d+:]+<.*),\W(?P<rte>.*)[a-zA-Z/]*\]"),
             "ffmpeg": re.compile(r"([a-zA-Z]+)=\s*(-?[\d|N/A]\S+)")}
+        self._encoding = locale.getpreferredencoding(False)
         self._first_loss_seen = False
         logger.debug("Initialized %s", self.__class__.__name__)
 
@@ -260,18 +273,53 @@ class FaceswapControl():
         self._thread = None
         self._command = command
 
+        # A new session on POSIX keeps terminal signals aimed at the GUI away from the task, so
+        # that the only exit signal the task receives is the one sent by :func:`terminate`
         proc = Popen(args,  # pylint:disable=consider-using-with
                      stdout=PIPE,
                      stderr=PIPE,
-                     bufsize=1,
-                     text=True,
+                     bufsize=0,
                      stdin=PIPE,
-                     errors="backslashreplace")
+                     close_fds=True,
+                     start_new_session=os.name != "nt")
         self._process = proc
+        self._readers = []
         self._thread_stdout()
         self._thread_stderr()
+        if self._gui_poll_id is None:
+            self._process_gui_queue()
         logger.debug("Executed Faceswap")
 
+    def _call_in_gui(self, func: T.Callable[..., None], *args) -> None:
+        """ Queue a function that updates the GUI so that it is executed in the main thread.
+
+        Tkinter is not thread safe, so the pipe readers must not update widgets or variables
+        directly.
+
+        Parameters
+        ----------
+        func: Callable
+            The function to execute in the main thread
+        args: tuple
+            The arguments to pass to the function
+        """
+        self._gui_queue.put((func, args))
+
+    def _process_gui_queue(self) -> None:
+        """ Execute any GUI updates queued by the pipe readers, in the order they were queued.
+        Reschedules itself for as long as a pipe reader is running or updates remain queued. """
+        while True:
+            try:
+                func, args = self._gui_queue.get_nowait()
+            except Empty:
+                break
+            func(*args)
+        if any(reader.is_alive() for reader in self._readers) or not self._gui_queue.empty():
+            self._gui_poll_id = self._config.root.after(_GUI_UPDATE_INTERVAL,
+                                                        self._process_gui_queue)
+        else:
+            self._gui_poll_id = None
+
     def _process_training_determinate_function(self, output: str) -> bool:
         """ Process an stdout/stderr message to check for determinate TQDM output when training
 
@@ -286,7 +334,7 @@ class FaceswapControl():
             ``True`` if a determinate TQDM line was parsed when training otherwise ``False``
         """
         if self._command == "train" and not self._first_loss_seen and self._capture_tqdm(output):
-            self._statusbar.set_mode("determinate")
+            self._call_in_gui(self._statusbar.set_mode, "determinate")
             return True
         return False
 
@@ -346,35 +394,130 @@ class FaceswapControl():
                                        is_training=True)
         tk_vars.refresh_graph.set(True)
 
-    def _read_stdout(self) -> None:
-        """ Read stdout from the subprocess. """
-        logger.debug("Opening stdout reader")
-        assert self._process is not None
+    def _decode(self, data: bytearray) -> list[str]:
+        """ Decode raw bytes read from a subprocess pipe into individual lines of text.
+
+        Carriage returns (as output by tqdm) are treated as line endings, in the same way as a
+        text mode pipe with universal newlines would treat them.
+
+        Parameters
+        ----------
+        data: bytearray
+            The bytes read from the subprocess pipe
+
+        Returns
+        -------
+        list[str]
+            The decoded lines of text, each ending with a newline character
+        """
+        text = data.decode(self._encoding, errors="backslashreplace")
+        lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if not lines[-1]:
+            lines.pop()
+        return [f"{line}\n" for line in lines]
+
+    def _read_lines(self, stream: T.IO[bytes]) -> T.Generator[list[str], None, None]:
+        """ Read from a subprocess pipe in large chunks rather than a line at a time, so that
+        verbose output does not incur a system call for every line.
+
+        Parameters
+        ----------
+        stream: :class:`io.FileIO`
+            The stdout or stderr pipe of the running subprocess
+
+        Yields
+        ------
+        list[str]
+            The complete lines of text contained within the latest chunk read from the pipe
+        """
+        try:
+            fdesc = stream.fileno()
+        except ValueError as err:
+            if str(err).lower().startswith("i/o operation on closed file"):
+                return
+            raise
+
+        buffer = bytearray()
         while True:
-            try:
-                buff = self._process.stdout
-                assert buff is not None
-                output: str = buff.readline()
-            except ValueError as err:
-                if str(err).lower().startswith("i/o operation on closed file"):
-                    break
-                raise
-
-            if output == "" and self._process.poll() is not None:
+            data = self._read_chunk(fdesc)
+            if not data:
                 break
+            buffer.extend(data)
+            lines = self._pop_complete_lines(buffer)
+            if lines:
+                yield lines
+
+        if buffer:
+            yield self._decode(buffer)
+
+    @classmethod
+    def _read_chunk(cls, fdesc: int) -> bytes:
+        """ Read the next chunk of available output from a subprocess pipe.
 
-            if output and self._process_progress_stdout(output):
-                continue
+        Parameters
+        ----------
+        fdesc: int
+            The file descriptor of the subprocess pipe
+
+        Returns
+        -------
+        bytes
+            Up to ``_READ_SIZE`` bytes of output. Empty if the pipe has been closed
+        """
+        try:
+            return os.read(fdesc, _READ_SIZE)
+        except OSError as err:
+            if err.errno == errno.EBADF:  # Pipe closed
+                return b""
+            raise
+
+    def _pop_complete_lines(self, buffer: bytearray) -> list[str]:
+        """ Remove all of the complete lines from the start of the read buffer and decode them.
+
+        Any partial line at the end of the buffer is left in place to be completed by the next
+        read from the pipe.
 
+        Parameters
+        ----------
+        buffer: bytearray
+            The bytes read from the subprocess pipe that have not yet been decoded. Complete
+            lines are removed in place
+
+        Returns
+        -------
+        list[str]
+            The decoded complete lines of text. An empty list if the buffer does not yet contain
+            a complete line
+        """
+        # Hold back a trailing carriage return as it may be the first half of a \r\n pair
+        end = len(buffer) - 1 if buffer.endswith(b"\r") else len(buffer)
+        idx = max(buffer.rfind(b"\n", 0, end), buffer.rfind(b"\r", 0, end))
+        if idx == -1:
+            return []
+        retval = self._decode(buffer[:idx + 1])
+        del buffer[:idx + 1]
+        return retval
+
+    def _read_stdout(self) -> None:
+        """ Read stdout from the subprocess. """
+        logger.debug("Opening stdout reader")
+        assert self._process is not None
+        assert self._process.stdout is not None
+        for lines in self._read_lines(self._process.stdout):
+            output = []
+            for line in lines:
+                if self._process_progress_stdout(line):
+                    continue
+                if self._command == "train":
+                    self._call_in_gui(self._process_training_stdout, line)
+                output.append(line)
             if output:
-                self._process_training_stdout(output)
-                print(output.rstrip())
+                sys.stdout.write("".join(output))
 
-        returncode = self._process.poll()
-        assert returncode is not None
+        returncode = self._process.wait()
         self._first_loss_seen = False
         message = self._set_final_status(returncode)
-        self._wrapper.terminate(message)
+        self._call_in_gui(self._wrapper.terminate, message)
         logger.debug("Terminated stdout reader. returncode: %s", returncode)
 
     def _read_stderr(self) -> None:
@@ -382,27 +525,21 @@ class FaceswapControl():
         values to Queue """
         logger.debug("Opening stderr reader")
         assert self._process is not None
-        while True:
-            try:
-                buff = self._process.stderr
-                assert buff is not None
-                output: str = buff.readline()
-            except ValueError as err:
-                if str(err).lower().startswith("i/o operation on closed file"):
-                    break
-                raise
-            if output == "" and self._process.poll() is not None:
-                break
-            if output:
-                if self._command != "train" and self._capture_tqdm(output):
+        assert self._process.stderr is not None
+        for lines in self._read_lines(self._process.stderr):
+            output = []
+            for line in lines:
+                if self._command != "train" and self._capture_tqdm(line):
                     continue
-                if self._process_training_determinate_function(output):
+                if self._process_training_determinate_function(line):
                     continue
-                if os.name == "nt" and "Call to CreateProcess failed. Error code: 2" in output:
+                if os.name == "nt" and "Call to CreateProcess failed. Error code: 2" in line:
                     # Suppress ptxas errors on Tensorflow for Windows
-                    logger.debug("Suppressed call to subprocess error: '%s'", output)
+                    logger.debug("Suppressed call to subprocess error: '%s'", line)
                     continue
-                print(output.strip(), file=sys.stderr)
+                output.append(line)
+            if output:
+                sys.stderr.write("".join(output))
         logger.debug("Terminated stderr reader")
 
     def _thread_stdout(self) -> None:
@@ -411,6 +548,7 @@ class FaceswapControl():
         thread = Thread(target=self._read_stdout)
         thread.daemon = True
         thread.start()
+        self._readers.append(thread)
         logger.debug("Threaded stdout")
 
     def _thread_stderr(self) -> None:
@@ -419,6 +557,7 @@ class FaceswapControl():
         thread = Thread(target=self._read_stderr)
         thread.daemon = True
         thread.start()
+        self._readers.append(thread)
         logger.debug("Threaded stderr")
 
     def _capture_loss(self, string: str) -> bool:
@@ -466,10 +605,10 @@ class FaceswapControl():
                    f"Session Iterations: {self._train_stats['iterations']}  {message}")
 
         if not self._first_loss_seen:
-            self._statusbar.set_mode("indeterminate")
+            self._call_in_gui(self._statusbar.set_mode, "indeterminate")
             self._first_loss_seen = True
 
-        self._statusbar.progress_update(message, 0, False)
+        self._call_in_gui(self._statusbar.progress_update, message, 0, False)
         logger.trace("Succesfully captured loss: %s", message)  # type:ignore[attr-defined]
         return True
 
@@ -524,7 +663,7 @@ class FaceswapControl():
         position = tqdm["pct"].replace("%", "")
         position = int(position) if position.isdigit() else 0
 
-        self._statusbar.progress_update(msg, position, True)
+        self._call_in_gui(self._statusbar.progress_update, msg, position, True)
         logger.trace("Succesfully captured tqdm message: %s", msg)  # type:ignore[attr-defined]
         return True
 
@@ -555,29 +694,50 @@ class FaceswapControl():
                 "Error creating ffmpeg message. Returning False")
             return False
 
-        self._statusbar.progress_update(message, 0, False)
+        self._call_in_gui(self._statusbar.progress_update, message, 0, False)
         logger.trace("Succesfully captured ffmpeg message: %s",  # type:ignore[attr-defined]
                      message)
         return True
 
-    def terminate(self) -> None:
+    def terminate(self, on_complete: T.Callable[[], None] | None = None) -> None:
         """ Terminate the running process in a LongRunningTask so console can still be updated
-        console """
-        if self._thread is None:
-            logger.debug("Terminating wrapper in LongRunningTask")
-            self._thread = LongRunningTask(target=self._terminate_in_thread,
-                                           args=(self._command, self._process))
-            if self._command == "train":
-                get_config().tk_vars.is_training.set(False)
-            self._thread.start()
-            self._config.root.after(1000, self.terminate)
-        elif not self._thread.complete.is_set():
+        console
+
+        Parameters
+        ----------
+        on_complete: Callable[[], None] | None, optional
+            A function to call once the process has exited. Used when the GUI is closing, as the
+            termination thread is a daemon and would otherwise be stopped with the GUI before the
+            process has been signalled to exit. Default: ``None``
+        """
+        if on_complete is not None:
+            self._on_terminated.append(on_complete)
+        if self._thread is not None:
+            logger.debug("Already terminating")
+            return
+        logger.debug("Terminating wrapper in LongRunningTask")
+        self._thread = LongRunningTask(target=self._terminate_in_thread,
+                                       args=(self._command, self._process))
+        if self._command == "train":
+            get_config().tk_vars.is_training.set(False)
+        self._thread.start()
+        self._config.root.after(1000, self._monitor_terminate)
+
+    def _monitor_terminate(self) -> None:
+        """ Poll the termination thread from the GUI's event loop, so that the GUI remains
+        responsive whilst the process exits. Once complete, clean up and call any functions
+        waiting on the process to exit. """
+        assert self._thread is not None
+        if not self._thread.complete.is_set():
             logger.debug("Not finished terminating")
-            self._config.root.after(1000, self.terminate)
-        else:
-            logger.debug("Termination Complete. Cleaning up")
-            _ = self._thread.get_result()  # Terminate the LongRunningTask object
-            self._thread = None
+            self._config.root.after(1000, self._monitor_terminate)
+            return
+        logger.debug("Termination Complete. Cleaning up")
+        _ = self._thread.get_result()  # Terminate the LongRunningTask object
+        self._thread = None
+        callbacks, self._on_terminated = self._on_terminated, []
+        for callback in callbacks:
+            callback()
 
     def _terminate_in_thread(self, command: str, process: Popen) -> bool:
         """ Terminate the subprocess
@@ -600,7 +760,6 @@ class FaceswapControl():
             timeout = self._config.user_config_dict.get("timeout", 120)
             logger.debug("Sending Exit Signal")
             print("Sending Exit Signal", flush=True)
-            now = time()
             if os.name == "nt":
                 logger.debug("Sending carriage return to process")
                 con_in = win32console.GetStdHandle(  # pylint:disable=c-extension-no-member
@@ -610,13 +769,11 @@ class FaceswapControl():
             else:
                 logger.debug("Sending SIGINT to process")
                 process.send_signal(signal.SIGINT)
-            while True:
-                timeelapsed = time() - now
-                if process.poll() is not None:
-                    break
-                if timeelapsed > timeout:
-                    logger.error("Timeout reached sending Exit Signal")
-                    self._terminate_all_children()
+            try:
+                process.wait(timeout=timeout)
+            except TimeoutExpired:
+                logger.error("Timeout reached sending Exit Signal")
+                self._terminate_all_children()
         else:
             self._terminate_all_children()
         return True
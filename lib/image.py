@@ -1355,12 +1355,10 @@ class FacesLoader(ImagesLoader):
             ``None``
         """
         if isinstance(self.location, (list, tuple)):
-            file_list = self.location
+            self._file_list = [fname for fname in self.location
+                               if os.path.splitext(fname)[-1].lower() == ".png"]
         else:
-            file_list = get_image_paths(self.location)
-
-        self._file_list = [fname for fname in file_list
-                           if os.path.splitext(fname)[-1].lower() == ".png"]
+            self._file_list = get_image_paths(self.location, extension=".png")
         self._count = len(self.file_list) if count is None else count
 
         logger.debug("count: %s", self.count)
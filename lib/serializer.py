@@ -9,7 +9,7 @@ import os
 import pickle
 import zlib
 
-from io import BytesIO
+from io import BytesIO, TextIOWrapper
 
 import numpy as np
 
@@ -71,7 +71,7 @@ class Serializer():
         filename = self._check_extension(filename)
         try:
             with open(filename, self._write_option) as s_file:
-                s_file.write(self.marshal(data))
+                self._write(s_file, data)
         except IOError as err:
             msg = f"Error writing to '{filename}': {err.strerror}"
             raise FaceswapError(msg) from err
@@ -105,9 +105,7 @@ class Serializer():
         logger.debug("filename: %s", filename)
         try:
             with open(filename, self._read_option) as s_file:
-                data = s_file.read()
-                logger.debug("stored data type: %s", type(data))
-                retval = self.unmarshal(data)
+                retval = self._read(s_file)
 
         except IOError as err:
             msg = f"Error reading from '{filename}': {err.strerror}"
@@ -171,6 +169,37 @@ class Serializer():
         logger.debug("returned data type: %s", type(retval))
         return retval
 
+    def _write(self, s_file, data):
+        """ Serialize data and write it to an open file. Override for serializers that can stream
+        directly to file.
+
+        Parameters
+        ----------
+        s_file: file object
+            The file opened in :attr:`_write_option` mode to write the serialized data to
+        data: varies
+            The data that is to be serialized to file
+        """
+        s_file.write(self.marshal(data))
+
+    def _read(self, s_file):
+        """ Read and unserialize data from an open file. Override for serializers that can stream
+        directly from file.
+
+        Parameters
+        ----------
+        s_file: file object
+            The file opened in :attr:`_read_option` mode to read the serialized data from
+
+        Returns
+        -------
+        data: varies
+            The data in a python object format
+        """
+        data = s_file.read()
+        logger.debug("stored data type: %s", type(data))
+        return self.unmarshal(data)
+
     def _marshal(self, data):
         """ Override for serializer specific marshalling """
         raise NotImplementedError()
@@ -199,6 +228,36 @@ class _JSONSerializer(Serializer):
         super().__init__()
         self._file_extension = "json"
 
+    def _write(self, s_file, data):
+        """ Stream the JSON straight to file rather than holding the full encoded document in
+        memory """
+        logger.debug("data type: %s", type(data))
+        t_file = TextIOWrapper(s_file, encoding="utf-8")
+        try:
+            json.dump(data, t_file, indent=2)
+        except OSError:
+            raise  # File errors are reported by :func:`save`
+        except Exception as err:
+            msg = f"Error serializing data for type {type(data)}: {str(err)}"
+            raise FaceswapError(msg) from err
+        finally:
+            t_file.detach()
+
+    def _read(self, s_file):
+        """ Decode and parse the JSON directly from file """
+        t_file = TextIOWrapper(s_file, encoding="utf-8", errors="replace")
+        try:
+            retval = json.load(t_file)
+        except OSError:
+            raise  # File errors are reported by :func:`load`
+        except Exception as err:
+            msg = f"Error unserializing data from '{s_file.name}': {str(err)}"
+            raise FaceswapError(msg) from err
+        finally:
+            t_file.detach()
+        logger.debug("returned data type: %s", type(retval))
+        return retval
+
     def _marshal(self, data):
         return json.dumps(data, indent=2).encode("utf-8")
 
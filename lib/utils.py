@@ -248,21 +248,21 @@ def get_image_paths(directory: str, extension: str | None = None) -> list[str]:
     ['/path/to/directory/image1.jpg']
     """
     logger = logging.getLogger(__name__)
-    image_extensions = IMAGE_EXTENSIONS if extension is None else [extension]
-    dir_contents = []
+    image_extensions = tuple(IMAGE_EXTENSIONS if extension is None else [extension])
 
     if not os.path.exists(directory):
         logger.debug("Creating folder: '%s'", directory)
         directory = get_folder(directory)
 
-    dir_scanned = sorted(os.scandir(directory), key=lambda x: x.name)
-    logger.debug("Scanned Folder contains %s files", len(dir_scanned))
-    logger.trace("Scanned Folder Contents: %s", dir_scanned)  # type:ignore[attr-defined]
+    with os.scandir(directory) as dir_scanned:
+        entries = [(entry.name, entry.path) for entry in dir_scanned]
+    logger.debug("Scanned Folder contains %s files", len(entries))
+    logger.trace("Scanned Folder Contents: %s", entries)  # type:ignore[attr-defined]
 
-    for chkfile in dir_scanned:
-        if any(chkfile.name.lower().endswith(ext) for ext in image_extensions):
-            logger.trace("Adding '%s' to image list", chkfile.path)  # type:ignore[attr-defined]
-            dir_contents.append(chkfile.path)
+    # Filter before sorting, and check all extensions with a single endswith call
+    dir_contents = [path for _, path in sorted(entry for entry in entries
+                                               if entry[0].lower().endswith(image_extensions))]
+    logger.trace("Image list: %s", dir_contents)  # type:ignore[attr-defined]
 
     logger.debug("Returning %s images", len(dir_contents))
     return dir_contents
@@ -27,6 +27,7 @@ class FaceswapGui(tk.Tk):
 
         self.wrapper = ProcessWrapper()
         self.objects = dict()
+        self._is_closing = False
 
         get_images().delete_preview()
         preview_trigger().clear(trigger_type=None)
@@ -138,6 +139,9 @@ class FaceswapGui(tk.Tk):
             animation function continues to run even when
             tkinter has gone away """
         logger.debug("Close Requested")
+        if self._is_closing:
+            logger.debug("Already closing")
+            return
 
         if not self._confirm_close_on_running_task():
             return
@@ -145,8 +149,16 @@ class FaceswapGui(tk.Tk):
             return
 
         if self._config.tk_vars.running_task.get():
-            self.wrapper.task.terminate()
+            self._is_closing = True
+            task = "training" if self._config.tk_vars.is_training.get() else "the running task"
+            self._config.statusbar.message.set(f"Waiting for {task} to exit...")
+            self.wrapper.task.terminate(on_complete=self._destroy)
+            return
+        self._destroy()
 
+    def _destroy(self):
+        """ Save the session state and exit the GUI, once any running task has exited. """
+        logger.debug("Destroying GUI")
         self._last_session.save()
         get_images().delete_preview()
         preview_trigger().clear(trigger_type=None)
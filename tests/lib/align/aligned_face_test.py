@@ -0,0 +1,64 @@
+#!/usr/bin python3
+""" Pytest unit tests for :mod:`lib.align.aligned_face` """
+import numpy as np
+import pytest
+
+from lib.align.aligned_face import AlignedFace, get_legacy_matrices
+from lib.align.constants import _MEAN_FACE, LandmarkType
+
+
+def _get_landmarks(num_points: int, batch_size: int = 16) -> np.ndarray:
+    """ Obtain a batch of randomly placed, scaled, rotated and noisy landmarks based on the mean
+    face, including degenerate items that exercise the rank deficient paths of the Umeyama
+    calculation.
+
+    Parameters
+    ----------
+    num_points: int
+        The number of landmark points for each face. 68 or 51
+    batch_size: int, optional
+        The number of non-degenerate faces to generate. Default: 16
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The (`N`, `num_points`, 2) float32 landmarks
+    """
+    rng = np.random.default_rng(0)
+    base = _MEAN_FACE[LandmarkType.LM_2D_51]
+    if num_points == 68:
+        jaw_x = np.linspace(0., 1., num=17)
+        base = np.concatenate([np.stack([jaw_x, 0.4 + 0.6 * np.sin(jaw_x * np.pi)], axis=1),
+                               base])
+    faces = []
+    for _ in range(batch_size):
+        angle = rng.uniform(-np.pi / 4, np.pi / 4)
+        rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        points = (base @ rotation.T) * rng.uniform(50, 500) + rng.uniform(0, 1000, size=2)
+        faces.append(points + rng.normal(0, 3, size=points.shape))
+
+    faces.append(np.full_like(base, 100.))  # All points identical: rank 0
+    faces.append(np.stack([np.linspace(0., 200., num=len(base))] * 2, axis=1))  # Collinear
+    faces.append(faces[0] * [-1., 1.])  # Mirrored
+    return np.array(faces, dtype="float32")
+
+
+@pytest.mark.parametrize("num_points", (68, 51))
+def test_get_legacy_matrices(num_points: int) -> None:
+    """ Test that :func:`~lib.align.aligned_face.get_legacy_matrices` returns the same matrices
+    that :class:`~lib.align.aligned_face.AlignedFace` calculates for each individual face,
+    including for degenerate landmarks
+
+    Parameters
+    ----------
+    num_points: int
+        The number of landmark points for each face
+    """
+    landmarks = _get_landmarks(num_points)
+    matrices = get_legacy_matrices(landmarks)
+    assert matrices.shape == (len(landmarks), 2, 3)
+
+    for lms, matrix in zip(landmarks, matrices):
+        expected = AlignedFace(lms)._matrices["legacy"]  # pylint:disable=protected-access
+        np.testing.assert_allclose(matrix, expected, rtol=1e-10, atol=1e-10)
+        assert np.array_equal(np.isnan(matrix), np.isnan(expected))
@@ -0,0 +1,153 @@
+#!/usr/bin python3
+""" Pytest unit tests for :mod:`lib.gui.options` """
+from __future__ import annotations
+import types
+import typing as T
+
+import pytest
+import pytest_mock
+
+from lib.logger import log_setup
+# Need to setup logging to avoid trace/verbose errors
+log_setup("DEBUG", f"{__name__}.log", "PyTest, False")
+
+# pylint:disable=wrong-import-position,protected-access
+from lib.gui.options import CliOption, CliOptions  # noqa:E402
+from tests.utils import TkVarStub  # noqa:E402
+
+
+_ARGUMENTS: list[dict[str, T.Any]] = [
+    {"opts": ("-i", "--input-dir"), "dest": "input_dir", "help": "input"},
+    {"opts": ("-b", "--batch-size"), "type": int, "default": 16, "help": "batch size"},
+    {"opts": ("-s", "--scale"), "type": float, "default": 0.5, "help": "scale"},
+    {"opts": ("-f", "--flag"), "action": "store_true", "default": False, "help": "flag"},
+    {"opts": ("-m", "--modes"), "nargs": "+", "default": ["one", "two"], "help": "modes"}]
+""" list[dict[str, Any]]: A representative set of cli arguments, one for each data type """
+
+_VALUES: dict[str, T.Any] = {"Input Dir": "/path/to/input",
+                             "Batch Size": 64,
+                             "Scale": 0.75,
+                             "Flag": True,
+                             "Modes": "three"}
+""" dict[str, Any]: Non-default values for each of the options in :attr:`_ARGUMENTS` """
+
+
+class _CliArgs():
+    """ Stand-in for :class:`lib.cli.args.FaceSwapArgs` that holds :attr:`_ARGUMENTS`
+
+    Parameters
+    ----------
+    subparser: None
+        Unused
+    command: str
+        The command that the arguments belong to
+    """
+    def __init__(self, subparser: None, command: str) -> None:
+        self.info = f"{command} info"
+        self.argument_list = [dict(arg) for arg in _ARGUMENTS]
+        self.optional_arguments: list[dict[str, T.Any]] = []
+        self.global_arguments: list[dict[str, T.Any]] = []
+
+
+@pytest.fixture(name="cli_options")
+def cli_options_fixture(mocker: pytest_mock.MockerFixture) -> CliOptions:
+    """ An instance of :class:`~lib.gui.options.CliOptions` populated with an "extract" and a
+    "train" command from a mocked cli module, with tkinter variables replaced so a display is not
+    required.
+
+    Parameters
+    ----------
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for mocking the cli modules and tkinter variables
+
+    Returns
+    -------
+    :class:`~lib.gui.options.CliOptions`
+        The cli options for testing
+    """
+    module = types.ModuleType("args")
+    module.ExtractArgs = type("ExtractArgs", (_CliArgs, ), {})  # type:ignore[attr-defined]
+    module.TrainArgs = type("TrainArgs", (_CliArgs, ), {})  # type:ignore[attr-defined]
+    mocker.patch("lib.gui.options.CliOptions._get_modules",
+                 side_effect=lambda category: [module] if category == "faceswap" else [])
+    mocker.patch("lib.gui.control_helper.ControlPanelOption.get_tk_var",
+                 side_effect=lambda initial_value, track_modified: TkVarStub(initial_value))
+    return CliOptions()
+
+
+def _get_values(cli_options: CliOptions, command: str) -> dict[str, T.Any]:
+    """ Obtain the current value of each option for a command
+
+    Parameters
+    ----------
+    cli_options: :class:`~lib.gui.options.CliOptions`
+        The cli options to obtain the values from
+    command: str
+        The command to obtain the option values for
+
+    Returns
+    -------
+    dict[str, Any]
+        The option title mapped to the option's current value
+    """
+    return {title: opt.cpanel_option.get() for title, opt in cli_options.opts[command].items()
+            if isinstance(opt, CliOption)}
+
+
+def _set_values(cli_options: CliOptions) -> None:
+    """ Set every option for every command to the non-default values in :attr:`_VALUES`
+
+    Parameters
+    ----------
+    cli_options: :class:`~lib.gui.options.CliOptions`
+        The cli options to set the values for
+    """
+    for command in ("extract", "train"):
+        for title, value in _VALUES.items():
+            opt = cli_options.opts[command][title]
+            assert isinstance(opt, CliOption)
+            opt.cpanel_option.set(value)
+        assert _get_values(cli_options, command) == _VALUES
+
+
+_DEFAULTS = {"Input Dir": "",
+             "Batch Size": 16,
+             "Scale": 0.5,
+             "Flag": False,
+             "Modes": "one two"}
+_CLEARED = {"Input Dir": "",
+            "Batch Size": 0,
+            "Scale": 0,
+            "Flag": False,
+            "Modes": ""}
+
+
+@pytest.mark.parametrize(("action", "expected"),
+                         (("reset", _DEFAULTS), ("clear", _CLEARED)),
+                         ids=("reset", "clear"))
+def test_reset_clear(cli_options: CliOptions, action: str, expected: dict[str, T.Any]) -> None:
+    """ Test that :func:`~lib.gui.options.CliOptions.reset` and
+    :func:`~lib.gui.options.CliOptions.clear` update the values of the options for the given
+    command only, or for all commands when no command is given
+
+    Parameters
+    ----------
+    cli_options: :class:`~lib.gui.options.CliOptions`
+        The cli options to test
+    action: str
+        The name of the method to test
+    expected: dict[str, Any]
+        The expected option values after calling the method
+    """
+    assert len(cli_options._options_to_process()) == 2 * len(_ARGUMENTS)
+    _set_values(cli_options)
+    func = getattr(cli_options, action)
+
+    func("train")
+    assert _get_values(cli_options, "train") == expected
+    assert _get_values(cli_options, "extract") == _VALUES
+
+    _set_values(cli_options)
+    func()
+    assert _get_values(cli_options, "train") == expected
+    assert _get_values(cli_options, "extract") == expected
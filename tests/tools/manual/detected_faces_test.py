@@ -0,0 +1,283 @@
+#!/usr/bin python3
+""" Pytest unit tests for :mod:`tools.manual.detected_faces` """
+from __future__ import annotations
+import typing as T
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+import pytest_mock
+
+from lib.logger import log_setup
+# Need to setup logging to avoid trace/verbose errors
+log_setup("DEBUG", f"{__name__}.log", "PyTest, False")
+
+# pylint:disable=wrong-import-position,protected-access
+from lib.align.constants import _MEAN_FACE, LandmarkType  # noqa:E402
+from tools.manual.detected_faces import DetectedFaces  # noqa:E402
+from tests.utils import TkVarStub  # noqa:E402
+
+if T.TYPE_CHECKING:
+    from lib.align.alignments import AlignmentFileDict
+
+
+def _get_landmarks(rng: np.random.Generator) -> np.ndarray:
+    """ Obtain a plausible set of 68 point landmarks at a random location, scale and with some
+    noise, so that faces have differing distances from the mean face.
+
+    Parameters
+    ----------
+    rng: :class:`numpy.random.Generator`
+        The random number generator to use
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The (68, 2) float32 landmarks
+    """
+    jaw_x = np.linspace(0., 1., num=17)
+    jaw = np.stack([jaw_x, 0.4 + 0.6 * np.sin(jaw_x * np.pi)], axis=1)
+    points = np.concatenate([jaw, _MEAN_FACE[LandmarkType.LM_2D_51]])
+    points = points * rng.uniform(100, 200) + rng.uniform(0, 300, size=2)
+    points += rng.normal(0, rng.uniform(0.5, 15.), size=points.shape)
+    return points.astype("float32")
+
+
+def _get_alignment(rng: np.random.Generator) -> AlignmentFileDict:
+    """ Obtain a minimal alignment for a single face with random landmarks
+
+    Parameters
+    ----------
+    rng: :class:`numpy.random.Generator`
+        The random number generator to use
+
+    Returns
+    -------
+    :class:`~lib.align.alignments.AlignmentFileDict`
+        The alignment for a single face
+    """
+    landmarks = _get_landmarks(rng)
+    left, top = landmarks.min(axis=0).astype("int32").tolist()
+    right, bottom = landmarks.max(axis=0).astype("int32").tolist()
+    return {"x": left, "w": right - left, "y": top, "h": bottom - top,
+            "landmarks_xy": landmarks, "mask": {}, "identity": {}, "thumb": None}
+
+
+@pytest.fixture(name="detected_faces")
+def detected_faces_fixture(mocker: pytest_mock.MockerFixture) -> DetectedFaces:
+    """ An instance of :class:`~tools.manual.detected_faces.DetectedFaces` with its faces loaded
+    from a mocked alignments file and tkinter variables replaced, so a display is not required.
+
+    Parameters
+    ----------
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for mocking the alignments file and tkinter variables
+
+    Returns
+    -------
+    :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object with faces loaded
+    """
+    face_counts = [0, 1, 2, 0, 3, 1, 0, 0, 2, 1]
+    rng = np.random.default_rng(0)
+
+    alignments = MagicMock()
+    alignments.data = {f"frame_{idx:04d}.png": {"faces": [_get_alignment(rng)
+                                                          for _ in range(count)]}
+                       for idx, count in enumerate(face_counts)}
+    mocker.patch("tools.manual.detected_faces.DetectedFaces._get_alignments",
+                 return_value=alignments)
+    mocker.patch("tools.manual.detected_faces.DetectedFaces._set_tk_vars",
+                 return_value={name: TkVarStub(False)
+                               for name in ("unsaved", "edited", "face_count_changed")})
+
+    tk_globals = MagicMock()
+    tk_globals.var_filter_mode = TkVarStub("All Frames")
+    tk_globals.var_filter_distance = TkVarStub(0)
+    extractor = MagicMock()
+    extractor.get_landmarks.side_effect = lambda *args: _get_landmarks(rng)
+
+    retval = DetectedFaces(tk_globals, "alignments.fsa", "frames", extractor)
+    retval.load_faces()
+    return retval
+
+
+def test_revert_after_save(detected_faces: DetectedFaces) -> None:
+    """ Test that moving a face after saving does not alter the saved alignments, so that the
+    face can be reverted to its saved position.
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to test
+    """
+    frame_index = 2
+    face = detected_faces.current_faces[frame_index][0]
+    detected_faces.update.landmarks(frame_index, 0, 5, 3)
+    detected_faces.save()
+    saved = detected_faces._alignments.data["frame_0002.png"]["faces"][0]
+    saved_landmarks = face.landmarks_xy.copy()
+    saved_box = (face.left, face.top)
+    assert np.array_equal(saved["landmarks_xy"], saved_landmarks)
+
+    detected_faces.update.landmarks(frame_index, 0, 20, -10)
+    assert np.array_equal(saved["landmarks_xy"], saved_landmarks)
+    assert (saved["x"], saved["y"]) == saved_box
+
+    detected_faces.revert_to_saved(frame_index)
+    face = detected_faces.current_faces[frame_index][0]
+    assert (face.left, face.top) == saved_box
+    assert np.array_equal(face.landmarks_xy, saved_landmarks)
+    assert not detected_faces.is_frame_updated(frame_index)
+
+
+_FILTER_MODES = ("All Frames", "Has Face(s)", "No Faces", "Multiple Faces", "Misaligned Faces")
+
+
+def _set_filter(detected_faces: DetectedFaces, filter_mode: str) -> None:
+    """ Set the filter mode and, for the misaligned filter, a distance that splits the faces
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to set the filter for
+    filter_mode: str
+        The navigation filter mode to select
+    """
+    distances = [face.aligned.average_distance
+                 for faces in detected_faces.current_faces for face in faces]
+    detected_faces._globals.var_filter_mode.set(filter_mode)
+    detected_faces._globals.var_filter_distance.set(float(np.median(distances)) * 100)
+
+
+def _expected_frames(detected_faces: DetectedFaces) -> list[int]:
+    """ Obtain the frame indices that meet the current filter criteria by checking each frame's
+    faces directly
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to obtain the filtered frames for
+
+    Returns
+    -------
+    list[int]
+        The frame indices that meet the current filter criteria
+    """
+    filter_mode = detected_faces._globals.var_filter_mode.get()
+    distance = detected_faces._globals.var_filter_distance.get() / 100.
+    criteria: dict[str, T.Callable[[list], bool]] = {
+        "All Frames": lambda faces: True,
+        "Has Face(s)": lambda faces: len(faces) > 0,
+        "No Faces": lambda faces: not faces,
+        "Multiple Faces": lambda faces: len(faces) > 1,
+        "Misaligned Faces": lambda faces: any(face.aligned.average_distance > distance
+                                              for face in faces)}
+    return [idx for idx, faces in enumerate(detected_faces.current_faces)
+            if criteria[filter_mode](faces)]
+
+
+def _check_frame_stats(detected_faces: DetectedFaces) -> None:
+    """ Check that the per frame face counts and distances match the current faces
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to check
+    """
+    faces = detected_faces.current_faces
+    assert detected_faces.face_count_per_index.tolist() == [len(f) for f in faces]
+    assert detected_faces.distance_per_index.tolist() == [
+        max((face.aligned.average_distance for face in f), default=-np.inf) for f in faces]
+
+
+@pytest.mark.parametrize("filter_mode", _FILTER_MODES)
+def test_filter_frames(detected_faces: DetectedFaces, filter_mode: str) -> None:
+    """ Test that :class:`~tools.manual.detected_faces.Filter` returns the correct frames, count
+    and face indices for each filter mode
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to test
+    filter_mode: str
+        The navigation filter mode to test
+    """
+    _set_filter(detected_faces, filter_mode)
+    frames = _expected_frames(detected_faces)
+    assert 0 < len(frames) < len(detected_faces.current_faces) or filter_mode == "All Frames"
+
+    assert detected_faces.filter.frames_list == frames
+    assert detected_faces.filter.count == len(frames)
+    raw_indices = detected_faces.filter.raw_indices
+    expected = [(frame_idx, face_idx)
+                for frame_idx in frames
+                for face_idx in range(len(detected_faces.current_faces[frame_idx]))]
+    assert list(zip(raw_indices["frame"], raw_indices["face"])) == expected
+
+
+@pytest.mark.parametrize("filter_mode", _FILTER_MODES)
+def test_filter_get_neighbours(detected_faces: DetectedFaces, filter_mode: str) -> None:
+    """ Test that :func:`~tools.manual.detected_faces.Filter.get_neighbours` returns the frames
+    at the given offsets within the filtered frames, excludes offsets outside of the filtered
+    frames and returns ``None`` for frames which do not meet the filter criteria
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to test
+    filter_mode: str
+        The navigation filter mode to test
+    """
+    _set_filter(detected_faces, filter_mode)
+    frames = _expected_frames(detected_faces)
+    offsets = [-20, -2, -1, 0, 1, 2, 3, 20]
+    for frame_index in range(len(detected_faces.current_faces)):
+        neighbours = detected_faces.filter.get_neighbours(frame_index, offsets)
+        if frame_index not in frames:
+            assert neighbours is None
+            continue
+        position = frames.index(frame_index)
+        assert neighbours == [frames[position + offset] for offset in offsets
+                              if 0 <= position + offset < len(frames)]
+
+
+def test_frame_stats_on_edit(detected_faces: DetectedFaces) -> None:
+    """ Test that the per frame face counts and distances, and the filtered frames, are kept up
+    to date when faces are added, deleted, copied and reverted
+
+    Parameters
+    ----------
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces object to test
+    """
+    _check_frame_stats(detected_faces)
+    _set_filter(detected_faces, "No Faces")
+
+    detected_faces.update.add(0, 10, 100, 20, 100)
+    _check_frame_stats(detected_faces)
+    assert 0 not in detected_faces.filter.frames_list
+
+    detected_faces.update.delete(1, 0)
+    _check_frame_stats(detected_faces)
+    assert detected_faces.filter.frames_list == _expected_frames(detected_faces)
+    assert 1 in detected_faces.filter.frames_list
+
+    detected_faces.update.delete(4, 1)
+    _check_frame_stats(detected_faces)
+
+    detected_faces.update.copy(6, "prev")
+    detected_faces.update.copy(7, "next")
+    _check_frame_stats(detected_faces)
+    assert [len(faces) for faces in detected_faces.current_faces[6:9]] == [1, 2, 2]
+
+    for filter_mode in _FILTER_MODES:
+        _set_filter(detected_faces, filter_mode)
+        assert detected_faces.filter.frames_list == _expected_frames(detected_faces)
+        assert detected_faces.filter.count == len(_expected_frames(detected_faces))
+
+    for frame_index in (0, 4, 6):
+        detected_faces.revert_to_saved(frame_index)
+        _check_frame_stats(detected_faces)
+    assert [len(faces) for faces in detected_faces.current_faces[:7]] == [0, 0, 2, 0, 3, 1, 0]
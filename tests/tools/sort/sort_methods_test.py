@@ -0,0 +1,421 @@
+#!/usr/bin python3
+""" Pytest unit tests for :mod:`tools.sort.sort_methods` """
+from __future__ import annotations
+import os
+import typing as T
+
+from argparse import Namespace
+
+import cv2
+import numpy as np
+import pytest
+import pytest_mock
+
+from lib.logger import log_setup
+# Need to setup logging to avoid trace/verbose errors
+log_setup("DEBUG", f"{__name__}.log", "PyTest, False")
+
+# pylint:disable=wrong-import-position,protected-access
+from tools.sort.sort_methods import SortHistogram  # noqa:E402
+
+if T.TYPE_CHECKING:
+    from collections.abc import Generator
+
+_NUM_FACES = 6
+
+
+@pytest.fixture(name="faces_folder")
+def faces_folder_fixture(tmp_path: str) -> Generator[str, None, None]:
+    """ Fixture for creating a folder of dummy faces with differing histograms
+
+    Parameters
+    ----------
+    tmp_path: str
+        pytest temporary path to generate folders
+
+    Yields
+    ------
+    str
+        Path to the folder of dummy faces
+    """
+    folder = os.path.join(tmp_path, "faces")
+    os.mkdir(folder)
+    rng = np.random.default_rng(0)
+    for idx in range(_NUM_FACES):
+        image = rng.integers(idx * 30, idx * 30 + 60, size=(32, 32, 3), dtype="uint8")
+        cv2.imwrite(os.path.join(folder, f"face_{idx}.png"), image)
+    yield folder
+
+
+def _get_sorter(input_dir: str,
+                cache_histograms: bool = True,
+                keep_original: bool = True) -> SortHistogram:
+    """ Obtain a histogram sorter for the given folder
+
+    Parameters
+    ----------
+    input_dir: str
+        The folder of faces to sort
+    cache_histograms: bool, optional
+        Whether histograms should be cached in the input folder. Default: ``True``
+    keep_original: bool, optional
+        Whether the original files are being kept. Default: ``True``
+
+    Returns
+    -------
+    :class:`~tools.sort.sort_methods.SortHistogram`
+        The histogram sorter for the given folder
+    """
+    arguments = Namespace(input_dir=input_dir,
+                          sort_method="hist",
+                          group_method="none",
+                          num_bins=5,
+                          threshold=-1.0,
+                          cache_histograms=cache_histograms,
+                          keep_original=keep_original)
+    return SortHistogram(arguments)
+
+
+def _histograms(sorter: SortHistogram) -> dict[str, np.ndarray]:
+    """ Obtain a copy of each face's histogram from a sorter that has been run
+
+    Parameters
+    ----------
+    sorter: :class:`~tools.sort.sort_methods.SortHistogram`
+        The sorter to obtain the histograms from
+
+    Returns
+    -------
+    dict[str, :class:`numpy.ndarray`]
+        The full path to each face with its histogram
+    """
+    return {fname: T.cast(np.ndarray, hist).copy() for fname, hist in sorter._result}
+
+
+def _cache_file(folder: str) -> str:
+    """ str: The full path to the histogram cache file for the given folder """
+    return os.path.join(folder, SortHistogram._cache_name)
+
+
+@pytest.mark.parametrize("cache_histograms,keep_original",
+                         [(False, True), (False, False), (True, False)],
+                         ids=["no-cache", "no-cache-move", "cache-move"])
+def test_cache_not_written(faces_folder: str,
+                           cache_histograms: bool,
+                           keep_original: bool) -> None:
+    """ Test that the histogram cache is not written when caching is not requested or when the
+    original files are being moved
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    cache_histograms: bool
+        Whether histograms should be cached in the input folder
+    keep_original: bool
+        Whether the original files are being kept
+    """
+    sorter = _get_sorter(faces_folder,
+                         cache_histograms=cache_histograms,
+                         keep_original=keep_original)
+    assert len(sorter.sorted_filelist) == _NUM_FACES
+    assert not os.path.exists(_cache_file(faces_folder))
+
+
+def test_cache_hit(faces_folder: str, mocker: pytest_mock.MockerFixture) -> None:
+    """ Test that faces held in the histogram cache are not read again and give the same result
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for spying on the scoring of faces
+    """
+    uncached = _get_sorter(faces_folder, cache_histograms=False)
+    expected_order = uncached.sorted_filelist
+    expected = _histograms(uncached)
+
+    first = _get_sorter(faces_folder)
+    assert first.sorted_filelist == expected_order
+    assert os.path.isfile(_cache_file(faces_folder))
+
+    score = mocker.spy(SortHistogram, "score_image")
+    second = _get_sorter(faces_folder)
+    assert second.sorted_filelist == expected_order
+    score.assert_not_called()
+    cached = _histograms(second)
+    assert cached.keys() == expected.keys()
+    assert all(np.array_equal(cached[fname], expected[fname]) for fname in expected)
+
+
+def test_cache_mtime_invalidation(faces_folder: str, mocker: pytest_mock.MockerFixture) -> None:
+    """ Test that only faces which have been modified since they were cached are read again
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for spying on the scoring of faces
+    """
+    _ = _get_sorter(faces_folder).sorted_filelist
+
+    changed = os.path.join(faces_folder, "face_0.png")
+    cv2.imwrite(changed, np.full((32, 32, 3), 250, dtype="uint8"))
+    mtime = os.path.getmtime(changed) + 10
+    os.utime(changed, (mtime, mtime))
+
+    score = mocker.spy(SortHistogram, "score_image")
+    cached = _get_sorter(faces_folder)
+    cached_order = cached.sorted_filelist
+    assert score.call_count == 1
+    assert score.call_args.args[1] == changed
+
+    uncached = _get_sorter(faces_folder, cache_histograms=False)
+    assert cached_order == uncached.sorted_filelist
+    assert np.array_equal(_histograms(cached)[changed], _histograms(uncached)[changed])
+
+
+def test_cache_corrupt(faces_folder: str, mocker: pytest_mock.MockerFixture) -> None:
+    """ Test that a corrupt histogram cache means that every face is read, and that the cache is
+    then replaced
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for spying on the scoring of faces
+    """
+    with open(_cache_file(faces_folder), "wb") as cache:
+        cache.write(b"not a valid cache")
+
+    score = mocker.spy(SortHistogram, "score_image")
+    sorter = _get_sorter(faces_folder)
+    assert len(sorter.sorted_filelist) == _NUM_FACES
+    assert score.call_count == _NUM_FACES
+
+    with np.load(_cache_file(faces_folder)) as cache:
+        assert sorted(cache["filenames"].tolist()) == sorted(f"face_{idx}.png"
+                                                             for idx in range(_NUM_FACES))
+
+
+def _get_histograms(num_faces: int) -> list[tuple[str, np.ndarray]]:
+    """ Obtain random face histograms drawn from a few clusters of differing brightness, with
+    some exact duplicates so that there are tied scores
+
+    Parameters
+    ----------
+    num_faces: int
+        The number of histograms to generate
+
+    Returns
+    -------
+    list[tuple[str, :class:`numpy.ndarray`]]
+        A dummy filename with its (256, ) float32 histogram for each face, in the same form as
+        :attr:`~tools.sort.sort_methods.SortHistogram._result`
+    """
+    rng = np.random.default_rng(num_faces)
+    centers = rng.uniform(30, 225, size=4)
+    bins = np.arange(256)
+    hists = []
+    for _ in range(num_faces):
+        center = rng.choice(centers) + rng.normal(0, 8)
+        profile = 1000. * np.exp(-((bins - center) ** 2) / (2 * rng.uniform(10, 40) ** 2))
+        hists.append(rng.poisson(profile + 1.).astype("float32"))
+    for src, dst in rng.choice(num_faces, size=(num_faces // 6, 2), replace=False):
+        hists[dst] = hists[src].copy()
+    return [(f"face_{idx:03d}.png", hist) for idx, hist in enumerate(hists)]
+
+
+def _compare(hist_a: np.ndarray, hist_b: np.ndarray) -> float:
+    """ float: The Bhattacharyya distance between two histograms using OpenCV """
+    return cv2.compareHist(hist_a.reshape(256, 1), hist_b.reshape(256, 1),
+                           cv2.HISTCMP_BHATTACHARYYA)
+
+
+def _reference_sort_sim(result: list[tuple[str, np.ndarray]]) -> list[str]:
+    """ Sort by histogram similarity by comparing each pair of faces with OpenCV
+
+    Parameters
+    ----------
+    result: list[tuple[str, :class:`numpy.ndarray`]]
+        The filenames and histograms to sort
+
+    Returns
+    -------
+    list[str]
+        The sorted filenames
+    """
+    result = list(result)
+    for i in range(len(result) - 1):
+        min_score = float("inf")
+        j_min_score = i + 1
+        for j in range(i + 1, len(result)):
+            score = _compare(result[i][1], result[j][1])
+            if score < min_score:
+                min_score = score
+                j_min_score = j
+        result[i + 1], result[j_min_score] = result[j_min_score], result[i + 1]
+    return [fname for fname, _ in result]
+
+
+def _reference_sort_dissim(result: list[tuple[str, np.ndarray]]) -> list[str]:
+    """ Sort by histogram dissimilarity by comparing each pair of faces with OpenCV
+
+    Parameters
+    ----------
+    result: list[tuple[str, :class:`numpy.ndarray`]]
+        The filenames and histograms to sort
+
+    Returns
+    -------
+    list[str]
+        The sorted filenames
+    """
+    scores = [sum(_compare(hist, other) for j, (_, other) in enumerate(result) if i != j)
+              for i, (_, hist) in enumerate(result)]
+    order = sorted(range(len(result)), key=lambda idx: scores[idx], reverse=True)
+    return [result[idx][0] for idx in order]
+
+
+def _reference_binning(result: list[tuple[str, np.ndarray]], threshold: float
+                       ) -> list[list[str]]:
+    """ Group by histogram by comparing each face to every member of each group with OpenCV
+
+    Parameters
+    ----------
+    result: list[tuple[str, :class:`numpy.ndarray`]]
+        The filenames and histograms to group
+    threshold: float
+        The distance below which a face joins a group
+
+    Returns
+    -------
+    list[list[str]]
+        The filenames in each group
+    """
+    references = [[result[0][1]]]
+    bins = [[result[0][0]]]
+    for fname, hist in result[1:]:
+        current_key, current_score = -1, float("inf")
+        for key, group in enumerate(references):
+            score = sum(_compare(hist, ref) for ref in group) / len(group)
+            if score < current_score:
+                current_key, current_score = key, score
+        if current_score < threshold:
+            references[current_key].append(hist)
+            bins[current_key].append(fname)
+        else:
+            references.append([hist])
+            bins.append([fname])
+    return bins
+
+
+def _get_tie_keys(result: list[tuple[str, np.ndarray]], filenames: list[str]) -> list[int]:
+    """ Obtain the index of the first face with an identical histogram for each filename, so
+    that orders which differ only in which of two identical faces is placed first compare equal
+
+    Parameters
+    ----------
+    result: list[tuple[str, :class:`numpy.ndarray`]]
+        The filenames and histograms in their original order
+    filenames: list[str]
+        The sorted filenames to obtain the keys for
+
+    Returns
+    -------
+    list[int]
+        The key for each filename
+    """
+    first = {}
+    for idx, (fname, hist) in enumerate(result):
+        first[fname] = next(i for i in range(idx + 1) if np.array_equal(result[i][1], hist))
+    return [first[fname] for fname in filenames]
+
+
+_SORT_PARAMS = [(num_faces, block_size)
+                for num_faces in (2, 5, 24, 48)
+                for block_size in (SortHistogram._block_size, 64)]
+_SORT_IDS = [f"faces:{num_faces}-{'default' if block_size > 64 else 'small'}-block"
+             for num_faces, block_size in _SORT_PARAMS]
+
+
+@pytest.mark.parametrize(("num_faces", "block_size"), _SORT_PARAMS, ids=_SORT_IDS)
+def test_sort_sim(faces_folder: str,
+                  mocker: pytest_mock.MockerFixture,
+                  num_faces: int,
+                  block_size: int) -> None:
+    """ Test that sorting by histogram similarity gives the same order as comparing each pair of
+    faces with OpenCV. Where identical faces are tied, either may be placed first.
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for setting the number of comparisons held in memory at once
+    num_faces: int
+        The number of histograms to sort
+    block_size: int
+        The number of comparisons to hold in memory at once
+    """
+    mocker.patch.object(SortHistogram, "_block_size", block_size)
+    result = _get_histograms(num_faces)
+    sorter = _get_sorter(faces_folder, cache_histograms=False)
+    sorter._result = list(result)
+    sorter._sort_sim()
+    sorted_files = [fname for fname, _ in sorter._result]
+    assert sorted(sorted_files) == sorted(fname for fname, _ in result)
+    assert (_get_tie_keys(result, sorted_files) ==
+            _get_tie_keys(result, _reference_sort_sim(result)))
+
+
+@pytest.mark.parametrize(("num_faces", "block_size"), _SORT_PARAMS, ids=_SORT_IDS)
+def test_sort_dissim(faces_folder: str,
+                     mocker: pytest_mock.MockerFixture,
+                     num_faces: int,
+                     block_size: int) -> None:
+    """ Test that sorting by histogram dissimilarity gives the same order as comparing each pair
+    of faces with OpenCV, with tied faces kept in their original order
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    mocker: :class:`pytest_mock.MockerFixture`
+        Fixture for setting the number of comparisons held in memory at once
+    num_faces: int
+        The number of histograms to sort
+    block_size: int
+        The number of comparisons to hold in memory at once
+    """
+    mocker.patch.object(SortHistogram, "_block_size", block_size)
+    result = _get_histograms(num_faces)
+    sorter = _get_sorter(faces_folder, cache_histograms=False)
+    sorter._result = list(result)
+    sorter._sort_dissim()
+    assert [fname for fname, _ in sorter._result] == _reference_sort_dissim(result)
+
+
+@pytest.mark.parametrize("num_faces", (2, 5, 24, 48))
+@pytest.mark.parametrize("threshold", (0.2, 0.3, 0.5))
+def test_binning(faces_folder: str, num_faces: int, threshold: float) -> None:
+    """ Test that grouping by histogram gives the same groups as comparing each face to every
+    member of each group with OpenCV
+
+    Parameters
+    ----------
+    faces_folder: str
+        The folder of dummy faces
+    num_faces: int
+        The number of histograms to group
+    threshold: float
+        The distance below which a face joins a group
+    """
+    result = _get_histograms(num_faces)
+    sorter = _get_sorter(faces_folder, cache_histograms=False)
+    sorter._result = list(result)
+    sorter._threshold = threshold
+    assert sorter.binning() == _reference_binning(result, threshold)
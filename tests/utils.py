@@ -2,6 +2,7 @@
 """ Utils imported from Keras as their location changes between Tensorflow Keras and standard
 Keras. Also ensures testing consistency """
 import inspect
+import typing as T
 
 import numpy as np
 
@@ -110,3 +111,29 @@ def has_arg(func, name, accept_all=False):
         return False
     return (parameter.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
                                inspect.Parameter.KEYWORD_ONLY))
+
+
+class TkVarStub():
+    """ Stand-in for a tkinter variable, so that tests do not require a display
+
+    Parameters
+    ----------
+    value: Any, optional
+        The initial value of the variable. Default: ``None``
+    """
+    def __init__(self, value: T.Any = None) -> None:
+        self._value = value
+
+    def get(self) -> T.Any:
+        """ Any: The current value of the variable """
+        return self._value
+
+    def set(self, value: T.Any) -> None:
+        """ Set the value of the variable
+
+        Parameters
+        ----------
+        value: Any
+            The value to set
+        """
+        self._value = value
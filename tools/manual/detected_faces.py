@@ -8,13 +8,12 @@ import os
 import sys
 import tkinter as tk
 import typing as T
-from copy import deepcopy
 from queue import Queue, Empty
 
 import cv2
 import numpy as np
 
-from lib.align import Alignments, AlignedFace, DetectedFace
+from lib.align import Alignments, AlignedFace, DetectedFace, get_legacy_matrices
 from lib.gui.custom_widgets import PopupProgress
 from lib.gui.utils import FileHandler
 from lib.image import ImagesLoader, ImagesSaver, encode_image, generate_thumbnail
@@ -55,6 +54,8 @@ class DetectedFaces():
                      input_location, extractor)
         self._globals = tk_globals
         self._frame_faces: list[list[DetectedFace]] = []
+        self._face_counts = np.zeros((0, ), dtype="int32")
+        self._frame_distances = np.zeros((0, ), dtype="float64")
         self._updated_frame_indices: set[int] = set()
 
         self._alignments: Alignments = self._get_alignments(alignments_path, input_location)
@@ -132,12 +133,21 @@ class DetectedFaces():
         return self._alignments.video_meta_data
 
     @property
-    def face_count_per_index(self) -> list[int]:
-        """ list[int]: Count of faces for each frame. List is in frame index order.
+    def face_count_per_index(self) -> np.ndarray:
+        """ :class:`numpy.ndarray`: Count of faces for each frame, in frame index order.
 
-        The list needs to be calculated on the fly as the number of faces in a frame
-        can change based on user actions. """
-        return [len(faces) for faces in self._frame_faces]
+        The counts are updated whenever faces are added to or removed from a frame, so should
+        not be modified by the caller. """
+        return self._face_counts
+
+    @property
+    def distance_per_index(self) -> np.ndarray:
+        """ :class:`numpy.ndarray`: The largest average distance from the mean face of the faces
+        in each frame, in frame index order. Frames without faces hold ``-inf``.
+
+        The distances are updated whenever faces are added, removed or edited, so should not be
+        modified by the caller. """
+        return self._frame_distances
 
     # <<<< PUBLIC METHODS >>>> #
     def is_frame_updated(self, frame_index: int) -> bool:
@@ -159,6 +169,31 @@ class DetectedFaces():
         """ Load the faces as :class:`~lib.align.DetectedFace` objects from the alignments
         file. """
         self._io.load()
+        self._face_counts = np.fromiter((len(faces) for faces in self._frame_faces),
+                                        dtype="int32",
+                                        count=len(self._frame_faces))
+        self._frame_distances = np.fromiter((self._max_distance(faces)
+                                             for faces in self._frame_faces),
+                                            dtype="float64",
+                                            count=len(self._frame_faces))
+
+    def update_frame_stats(self, frame_index: int, count_changed: bool = True) -> None:
+        """ Update the face count and the largest average distance held for a frame after its
+        faces have been added, removed or re-aligned.
+
+        Parameters
+        ----------
+        frame_index: int
+            The frame index that has had its faces changed
+        count_changed: bool, optional
+            ``True`` if faces may have been added to or removed from the frame. ``False`` if the
+            existing faces have only been re-aligned, so just the distance is updated.
+            Default: ``True``
+        """
+        faces = self._frame_faces[frame_index]
+        if count_changed:
+            self._face_counts[frame_index] = len(faces)
+        self._frame_distances[frame_index] = self._max_distance(faces)
 
     def save(self) -> None:
         """ Save the alignments file with the latest edits. """
@@ -195,6 +230,22 @@ class DetectedFaces():
             self._alignments.save_video_meta_data(pts_time, keyframes)
 
     # <<<< PRIVATE METHODS >>> #
+    @staticmethod
+    def _max_distance(faces: list[DetectedFace]) -> float:
+        """ Obtain the largest average distance from the mean face for the given faces.
+
+        Parameters
+        ----------
+        faces: list[:class:`~lib.align.DetectedFace`]
+            The aligned faces within a frame
+
+        Returns
+        -------
+        float
+            The largest average distance of the given faces or ``-inf`` if there are no faces
+        """
+        return max((face.aligned.average_distance for face in faces), default=-np.inf)
+
     # << INIT >> #
     @staticmethod
     def _set_tk_vars() -> dict[T.Literal["unsaved", "edited", "face_count_changed"],
@@ -270,6 +321,7 @@ class _DiskIO():
         logger.debug("Initializing %s: (detected_faces: %s, input_location: %s)",
                      self.__class__.__name__, detected_faces, input_location)
         self._input_location = input_location
+        self._detected_faces = detected_faces
         self._alignments = detected_faces._alignments
         self._frame_faces = detected_faces._frame_faces
         self._updated_frame_indices = detected_faces._updated_frame_indices
@@ -284,16 +336,25 @@ class _DiskIO():
 
     def load(self) -> None:
         """ Load the faces from the alignments file, convert to
-        :class:`~lib.align.DetectedFace`. objects and add to :attr:`_frame_faces`. """
+        :class:`~lib.align.DetectedFace`. objects and add to :attr:`_frame_faces`.
+
+        The alignment matrices for all faces are calculated in a single batch, grouped by
+        landmark type, rather than individually for each face. """
+        batches: dict[tuple[int, ...], list[DetectedFace]] = {}
         for key in sorted(self._alignments.data):
             this_frame_faces: list[DetectedFace] = []
             for item in self._alignments.data[key]["faces"]:
                 face = DetectedFace()
                 face.from_alignment(item, with_thumb=True)
-                face.load_aligned(None)
-                _ = face.aligned.average_distance  # cache the distances
+                batches.setdefault(face.landmarks_xy.shape, []).append(face)
                 this_frame_faces.append(face)
             self._frame_faces.append(this_frame_faces)
+
+        for faces in batches.values():
+            matrices = get_legacy_matrices(np.array([face.landmarks_xy for face in faces]))
+            for face, matrix in zip(faces, matrices):
+                face.load_aligned(None, matrix=matrix)
+                _ = face.aligned.average_distance  # cache the distances
         self._sorted_frame_names = sorted(self._alignments.data)
 
     def save(self) -> None:
@@ -306,10 +367,10 @@ class _DiskIO():
         logger.verbose("Saving alignments for %s updated frames",  # type:ignore[attr-defined]
                        len(frames))
 
-        for idx, faces in zip(frames,
-                              np.array(self._frame_faces, dtype="object")[np.array(frames)]):
+        for idx in frames:
             frame = self._sorted_frame_names[idx]
-            self._alignments.data[frame]["faces"] = [face.to_alignment() for face in faces]
+            self._alignments.data[frame]["faces"] = [face.to_alignment()
+                                                     for face in self._frame_faces[idx]]
 
         self._alignments.backup()
         self._alignments.save()
@@ -333,11 +394,11 @@ class _DiskIO():
         faces = self._frame_faces[frame_index]
 
         reset_grid = self._add_remove_faces(alignments, faces)
-
         for detected_face, face in zip(faces, alignments):
             detected_face.from_alignment(face, with_thumb=True)
             detected_face.load_aligned(None, force=True)
             _ = detected_face.aligned.average_distance  # cache the distances
+        self._detected_faces.update_frame_stats(frame_index, count_changed=reset_grid)
 
         self._updated_frame_indices.remove(frame_index)
         if not self._updated_frame_indices:
@@ -520,34 +581,33 @@ class Filter():
         """ int: The number of frames that meet the filter criteria returned by
         :attr:`~tools.manual.manual.TkGlobals.var_filter_mode.get()`. """
         face_count_per_index = self._detected_faces.face_count_per_index
-        if self._globals.var_filter_mode.get() == "No Faces":
-            retval = sum(1 for fcount in face_count_per_index if fcount == 0)
-        elif self._globals.var_filter_mode.get() == "Has Face(s)":
-            retval = sum(1 for fcount in face_count_per_index if fcount != 0)
-        elif self._globals.var_filter_mode.get() == "Multiple Faces":
-            retval = sum(1 for fcount in face_count_per_index if fcount > 1)
-        elif self._globals.var_filter_mode.get() == "Misaligned Faces":
-            distance = self._filter_distance
-            retval = sum(1 for frame in self._detected_faces.current_faces
-                         if any(face.aligned.average_distance > distance for face in frame))
+        filter_mode = self._globals.var_filter_mode.get()
+        retval: int
+        if filter_mode == "No Faces":
+            retval = len(face_count_per_index) - int(np.count_nonzero(face_count_per_index))
+        elif filter_mode == "Has Face(s)":
+            retval = int(np.count_nonzero(face_count_per_index))
+        elif filter_mode == "Multiple Faces":
+            retval = int(np.count_nonzero(face_count_per_index > 1))
+        elif filter_mode == "Misaligned Faces":
+            retval = int(np.count_nonzero(self._detected_faces.distance_per_index >
+                                          self._filter_distance))
         else:
             retval = len(face_count_per_index)
         logger.trace("filter mode: %s, frame count: %s",  # type:ignore[attr-defined]
-                     self._globals.var_filter_mode.get(), retval)
+                     filter_mode, retval)
         return retval
 
     @property
     def raw_indices(self) -> dict[T.Literal["frame", "face"], list[int]]:
         """ dict[str, int]: The frame and face indices that meet the current filter criteria for
         each displayed face. """
-        frame_indices: list[int] = []
-        face_indices: list[int] = []
-        face_counts = self._detected_faces.face_count_per_index  # Copy to avoid recalculations
-
-        for frame_idx in self.frames_list:
-            for face_idx in range(face_counts[frame_idx]):
-                frame_indices.append(frame_idx)
-                face_indices.append(face_idx)
+        frames = self._get_frame_indices()
+        counts = self._detected_faces.face_count_per_index[frames]
+        # Each face index counts up from zero within its frame
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        frame_indices: list[int] = np.repeat(frames, counts).tolist()
+        face_indices: list[int] = (np.arange(len(starts)) - starts).tolist()
 
         retval: dict[T.Literal["frame", "face"], list[int]] = {"frame": frame_indices,
                                                                "face": face_indices}
@@ -559,23 +619,60 @@ class Filter():
     def frames_list(self) -> list[int]:
         """ list[int]: The list of frame indices that meet the filter criteria returned by
         :attr:`~tools.manual.manual.TkGlobals.var_filter_mode.get()`. """
-        face_count_per_index = self._detected_faces.face_count_per_index
-        if self._globals.var_filter_mode.get() == "No Faces":
-            retval = [idx for idx, count in enumerate(face_count_per_index) if count == 0]
-        elif self._globals.var_filter_mode.get() == "Multiple Faces":
-            retval = [idx for idx, count in enumerate(face_count_per_index) if count > 1]
-        elif self._globals.var_filter_mode.get() == "Has Face(s)":
-            retval = [idx for idx, count in enumerate(face_count_per_index) if count != 0]
-        elif self._globals.var_filter_mode.get() == "Misaligned Faces":
-            distance = self._filter_distance
-            retval = [idx for idx, frame in enumerate(self._detected_faces.current_faces)
-                      if any(face.aligned.average_distance > distance for face in frame)]
-        else:
-            retval = list(range(len(face_count_per_index)))
+        retval = self._get_frame_indices().tolist()
         logger.trace("filter mode: %s, number_frames: %s",  # type:ignore[attr-defined]
                      self._globals.var_filter_mode.get(), len(retval))
         return retval
 
+    def _get_frame_indices(self) -> np.ndarray:
+        """ Obtain the frame indices that meet the current filter criteria.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The sorted frame indices that meet the filter criteria returned by
+            :attr:`~tools.manual.manual.TkGlobals.var_filter_mode.get()`
+        """
+        face_count_per_index = self._detected_faces.face_count_per_index
+        filter_mode = self._globals.var_filter_mode.get()
+        if filter_mode == "No Faces":
+            retval = np.flatnonzero(face_count_per_index == 0)
+        elif filter_mode == "Multiple Faces":
+            retval = np.flatnonzero(face_count_per_index > 1)
+        elif filter_mode == "Has Face(s)":
+            retval = np.flatnonzero(face_count_per_index)
+        elif filter_mode == "Misaligned Faces":
+            retval = np.flatnonzero(self._detected_faces.distance_per_index >
+                                    self._filter_distance)
+        else:
+            retval = np.arange(len(face_count_per_index))
+        return retval
+
+    def get_neighbours(self, frame_index: int, offsets: T.Iterable[int]) -> list[int] | None:
+        """ Obtain the frames that are the given number of steps away from a frame when
+        navigating through the frames that meet the current filter criteria.
+
+        Parameters
+        ----------
+        frame_index: int
+            The frame index to obtain the neighbouring frames for
+        offsets: Iterable[int]
+            The number of filtered frames forwards (positive) or backwards (negative) from the
+            given frame to obtain the frame index for
+
+        Returns
+        -------
+        list[int] | None
+            The frame indices at each of the given offsets that exist within the filtered frames.
+            ``None`` if the given frame does not meet the current filter criteria
+        """
+        frames = self._get_frame_indices()
+        position = int(np.searchsorted(frames, frame_index))
+        if position == len(frames) or frames[position] != frame_index:
+            return None
+        return [int(frames[position + offset]) for offset in offsets
+                if 0 <= position + offset < len(frames)]
+
 
 class FaceUpdate():
     """ Perform updates on :class:`~lib.align.DetectedFace` objects stored in
@@ -664,6 +761,7 @@ class FaceUpdate():
 
         self.bounding_box(frame_index, face_index, pnt_x, width, pnt_y, height, aligner="cv2-dnn")
         face.load_aligned(None)
+        self._detected_faces.update_frame_stats(frame_index)
         self._tk_face_count_changed.set(True)
 
     def delete(self, frame_index: int, face_index: int) -> None:
@@ -680,6 +778,7 @@ class FaceUpdate():
         logger.debug("Deleting face at frame index: %s face index: %s", frame_index, face_index)
         faces = self._faces_at_frame_index(frame_index)
         del faces[face_index]
+        self._detected_faces.update_frame_stats(frame_index)
         self._tk_face_count_changed.set(True)
         self._globals.var_full_update.set(True)
 
@@ -753,19 +852,10 @@ class FaceUpdate():
             aligned = AlignedFace(face.landmarks_xy,
                                   centering="face",
                                   size=min(self._globals.frame_display_dims))
-            landmark = aligned.landmarks[landmark_index]
-            landmark += (shift_x, shift_y)
-            matrix = aligned.adjusted_matrix
-            matrix = cv2.invertAffineTransform(matrix)
-            if landmark.ndim == 1:
-                landmark = np.reshape(landmark, (1, 1, 2))
-                landmark = cv2.transform(landmark, matrix, landmark.shape).squeeze()
-                face.landmarks_xy[landmark_index] = landmark
-            else:
-                for lmk, idx in zip(landmark, landmark_index):  # type:ignore[call-overload]
-                    lmk = np.reshape(lmk, (1, 1, 2))
-                    lmk = cv2.transform(lmk, matrix, lmk.shape).squeeze()
-                    face.landmarks_xy[idx] = lmk
+            # Mapping the points into the zoomed face, shifting them and mapping them back is the
+            # same as shifting them in the frame by the shift mapped through the inverse matrix
+            matrix = cv2.invertAffineTransform(aligned.adjusted_matrix)
+            face.landmarks_xy[landmark_index] += matrix[:, :2] @ (shift_x, shift_y)
         else:
             face.landmarks_xy[landmark_index] += (shift_x, shift_y)
         self._globals.var_full_update.set(True)
@@ -795,7 +885,7 @@ class FaceUpdate():
         assert face.left is not None and face.top is not None
         face.left += shift_x
         face.top += shift_y
-        face.add_landmarks_xy(face.landmarks_xy + (shift_x, shift_y))
+        np.add(face.landmarks_xy, (shift_x, shift_y), out=face.landmarks_xy)
         self._globals.var_full_update.set(True)
 
     def landmarks_rotate(self,
@@ -882,30 +972,27 @@ class FaceUpdate():
         """
         logger.debug("frame: %s, direction: %s", frame_index, direction)
         faces = self._faces_at_frame_index(frame_index)
-        frames_with_faces = [idx for idx, faces in enumerate(self._detected_faces.current_faces)
-                             if len(faces) > 0]
+        face_counts = self._detected_faces.face_count_per_index
+        idx: int | None = None
         if direction == "prev":
-            idx = next((idx for idx in reversed(frames_with_faces)
-                        if idx < frame_index), None)
+            frames_with_faces = np.flatnonzero(face_counts[:frame_index])
+            if frames_with_faces.size:
+                idx = int(frames_with_faces[-1])
         else:
-            idx = next((idx for idx in frames_with_faces
-                        if idx > frame_index), None)
+            frames_with_faces = np.flatnonzero(face_counts[frame_index + 1:])
+            if frames_with_faces.size:
+                idx = frame_index + 1 + int(frames_with_faces[0])
         if idx is None:
             # No previous/next frame available
             return
         logger.debug("Copying alignments from frame %s to frame: %s", idx, frame_index)
 
-        # aligned_face cannot be deep copied, so remove and recreate
-        to_copy = self._faces_at_frame_index(idx)
-        for face in to_copy:
-            face._aligned = None  # pylint:disable=protected-access
-        copied = deepcopy(to_copy)
-
-        for old_face, new_face in zip(to_copy, copied):
-            old_face.load_aligned(None)
-            new_face.load_aligned(None)
+        copied = [face.clone() for face in self._frame_faces[idx]]
+        for face in copied:
+            face.load_aligned(None)
 
         faces.extend(copied)
+        self._detected_faces.update_frame_stats(frame_index)
         self._tk_face_count_changed.set(True)
         self._globals.var_full_update.set(True)
 
@@ -922,6 +1009,7 @@ class FaceUpdate():
         """
         face = self._frame_faces[frame_index][face_index]
         face.load_aligned(None, force=True)  # Update average distance
+        self._detected_faces.update_frame_stats(frame_index, count_changed=False)
         face.mask = self._extractor.get_masks(frame_index, face_index)
         face.clear_all_identities()
 
@@ -514,6 +514,8 @@ class Grid():
         self._detected_faces = detected_faces
         self._raw_indices = detected_faces.filter.raw_indices
         self._frames_list = detected_faces.filter.frames_list
+        self._sorted_faces = np.array(self._raw_indices["frame"], dtype="int64")
+        self._sorted_frames = np.array(self._frames_list, dtype="int64")
 
         self._is_valid: bool = False
         self._face_size: int = 0
@@ -609,7 +611,9 @@ class Grid():
             The y coordinate of the first face for the given frame
         """
         assert self._grid is not None
-        return min(self._grid[3][np.where(self._grid[0] == frame_index)])
+        position = self._first_face_position(frame_index)
+        assert position is not None
+        return int(self._grid[3].flat[position])
 
     def frame_has_faces(self, frame_index: int) -> bool | np.bool_:
         """ Check whether the given frame index contains any faces.
@@ -626,8 +630,29 @@ class Grid():
         """
         if not self._is_valid:
             return False
-        assert self._grid is not None
-        return np.any(self._grid[0] == frame_index)
+        return self._first_face_position(frame_index) is not None
+
+    def _first_face_position(self, frame_index: int) -> int | None:
+        """ Locate the flat grid position of the first face for the given frame index.
+
+        Faces are laid out in frame order, so the position is found with a binary search of
+        the filtered frame indices rather than scanning the full grid.
+
+        Parameters
+        ----------
+        frame_index: int
+            The frame index to locate in the grid
+
+        Returns
+        -------
+        int | None
+            The flat position within the grid of the first face in the given frame. ``None`` if
+            the frame has no faces in the current filter
+        """
+        position = int(np.searchsorted(self._sorted_faces, frame_index))
+        if position == len(self._sorted_faces) or self._sorted_faces[position] != frame_index:
+            return None
+        return position
 
     def update(self) -> None:
         """ Update the underlying grid.
@@ -639,6 +664,8 @@ class Grid():
         self._face_size = self._canvas.face_size
         self._raw_indices = self._detected_faces.filter.raw_indices
         self._frames_list = self._detected_faces.filter.frames_list
+        self._sorted_faces = np.array(self._raw_indices["frame"], dtype="int64")
+        self._sorted_frames = np.array(self._frames_list, dtype="int64")
         self._get_grid()
         self._get_display_faces()
         self._canvas.coords("backdrop", 0, 0, *self.dimensions)
@@ -737,7 +764,11 @@ class Grid():
             The index of the requested frame within the filtered frames view. None if no valid
             frames
         """
-        retval = self._frames_list.index(frame_index) if frame_index in self._frames_list else None
+        position = int(np.searchsorted(self._sorted_frames, frame_index))
+        retval = (position
+                  if position < len(self._sorted_frames)
+                  and self._sorted_frames[position] == frame_index
+                  else None)
         logger.trace("frame_index: %s, transport_index: %s",  # type:ignore[attr-defined]
                      frame_index, retval)
         return retval
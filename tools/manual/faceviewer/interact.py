@@ -290,13 +290,13 @@ class ActiveFrame():
                 self._grid.frame_has_faces(self.frame_index)):
             y_coord = self._grid.y_coord_from_frame(self.frame_index)
             logger.trace("Active not in view. Moving to: %s", y_coord)  # type:ignore[attr-defined]
-            self._canvas.yview_moveto(y_coord / self._canvas.bbox("backdrop")[3])
+            self._canvas.yview_moveto(y_coord / self._grid.dimensions[1])
             self._viewport.update()
 
     def move_to_top(self) -> None:
         """ Move the currently selected frame's faces to the top of the viewport if they are moving
         off the bottom of the viewer. """
-        height = self._canvas.bbox("backdrop")[3]
+        height = self._grid.dimensions[1]
         bot = int(self._canvas.coords(self._assets.images[-1])[1] + self._size)
 
         y_top, y_bot = (int(round(pnt * height)) for pnt in self._canvas.yview())
@@ -352,7 +352,14 @@ class ActiveFrame():
         self._tk_vars["edited"].set(False)
 
     def _update_face(self) -> None:
-        """ Update the highlighted annotations for faces in the currently selected frame. """
+        """ Update the highlighted annotations for faces in the currently selected frame.
+
+        Each face's mesh objects are placed and tagged individually, then the display options are
+        applied to all of the active mesh objects with a single call for each mesh type. If the
+        mesh is hidden, because the mask editor is selected without the optional mesh annotation,
+        then the mesh landmarks are not calculated or placed. """
+        show_mesh = (self._tk_vars["selected_editor"].get() != "Mask" or
+                     self._optional_annotations["mesh"])
         for face_idx, (image_id, mesh_ids, box_id, det_face), in enumerate(
                 zip(self._assets.images,
                     self._assets.meshes,
@@ -365,7 +372,10 @@ class ActiveFrame():
             tk_face = self._viewport.get_tk_face(self.frame_index, face_idx, det_face)
             self._canvas.itemconfig(image_id, image=tk_face.photo)
             self._show_box(box_id, coords)
-            self._show_mesh(mesh_ids, face_idx, det_face, top_left)
+            if show_mesh:
+                self._show_mesh(mesh_ids, face_idx, det_face, top_left)
+        if show_mesh:
+            self._configure_active_meshes()
         self._last_execution["size"] = self._viewport.face_size
 
     def _show_box(self, item_id: int, coordinates: list[float]) -> None:
@@ -386,7 +396,8 @@ class ActiveFrame():
                    face_index: int,
                    detected_face: DetectedFace,
                    top_left: list[float]) -> None:
-        """ Display the mesh annotation for the given face, at the given location.
+        """ Place the mesh annotation for the given face at the given location, and tag it as an
+        active mesh.
 
         Parameters
         ----------
@@ -400,12 +411,6 @@ class ActiveFrame():
         top_left: list[float]
             The (x, y) top left co-ordinates of the mesh's bounding box
         """
-        state = "normal" if (self._tk_vars["selected_editor"].get() != "Mask" or
-                             self._optional_annotations["mesh"]) else "hidden"
-        kwargs: dict[T.Literal["polygon", "line"], dict[str, T.Any]] = {
-            "polygon": {"fill": "", "width": 2, "outline": self._canvas.control_colors["Mesh"]},
-            "line": {"fill": self._canvas.control_colors["Mesh"], "width": 2}}
-
         assert isinstance(self._tk_vars["edited"], tk.BooleanVar)
         edited = (self._tk_vars["edited"].get() and
                   self._tk_vars["selected_editor"].get() not in ("Mask", "View"))
@@ -414,10 +419,16 @@ class ActiveFrame():
                                                  detected_face,
                                                  top_left,
                                                  edited)
-        for key, kwarg in kwargs.items():
-            if key not in mesh_ids:
-                continue
-            for idx, mesh_id in enumerate(mesh_ids[key]):
-                self._canvas.coords(mesh_id, *landmarks[key][idx].flatten())
-                self._canvas.itemconfig(mesh_id, state=state, **kwarg)
+        for key, area in mesh_ids.items():
+            for idx, mesh_id in enumerate(area):
+                self._canvas.coords(mesh_id, *landmarks[key][idx].ravel().tolist())
                 self._canvas.addtag_withtag(f"active_mesh_{key}", mesh_id)
+
+    def _configure_active_meshes(self) -> None:
+        """ Apply the active display options to every mesh object that has been tagged as being in
+        the currently selected frame. """
+        kwargs: dict[T.Literal["polygon", "line"], dict[str, T.Any]] = {
+            "polygon": {"fill": "", "width": 2, "outline": self._canvas.control_colors["Mesh"]},
+            "line": {"fill": self._canvas.control_colors["Mesh"], "width": 2}}
+        for key, kwarg in kwargs.items():
+            self._canvas.itemconfig(f"active_mesh_{key}", state="normal", **kwarg)
@@ -37,7 +37,7 @@ class Viewport():
         self._grid = canvas.layout
         self._centering: CenteringType = "face"
         self._tk_selected_editor = canvas._display_frame.tk_selected_action
-        self._landmarks: dict[str, dict[T.Literal["polygon", "line"], list[np.ndarray]]] = {}
+        self._landmarks: dict[str, tuple[np.ndarray, np.ndarray, LandmarkType]] = {}
         self._tk_faces: dict[str, TKFace] = {}
         self._objects = VisibleObjects(self)
         self._hoverbox = HoverBox(self)
@@ -106,7 +106,10 @@ class Viewport():
         self.update()
 
     @classmethod
-    def _obtain_mask(cls, detected_face: DetectedFace, mask_type: str) -> np.ndarray | None:
+    def _obtain_mask(cls,
+                     detected_face: DetectedFace,
+                     mask_type: str,
+                     is_active: bool = False) -> np.ndarray | None:
         """ Obtain the mask for the correct "face" centering that is used in the thumbnail display.
 
         Parameters
@@ -115,6 +118,9 @@ class Viewport():
             The Detected Face object to obtain the mask for
         mask_type: str
             The type of mask to obtain
+        is_active: bool, optional
+            ``True`` if the face is in the currently active frame, and so may be mid-edit,
+            otherwise ``False``. Default: ``False``
 
         Returns
         -------
@@ -125,10 +131,12 @@ class Viewport():
         if not mask:
             return None
         if mask.stored_centering != "face":
-            face = AlignedFace(detected_face.landmarks_xy)
-            mask.set_sub_crop(face.pose.offset[mask.stored_centering],
-                              face.pose.offset["face"],
-                              centering="face")
+            # The detected face's aligned face is only reloaded when an edit completes, so its
+            # cached pose is stale whilst the active frame's landmarks are being dragged
+            pose = (AlignedFace(detected_face.landmarks_xy).pose if is_active
+                    else detected_face.aligned.pose)
+            offset = pose.offset
+            mask.set_sub_crop(offset[mask.stored_centering], offset["face"], centering="face")
         return mask.mask.squeeze()
 
     def reset(self) -> None:
@@ -190,8 +198,7 @@ class Viewport():
                 if (self._canvas.optional_annotations["mesh"]
                         or frame_idx == self._active_frame.frame_index
                         or refresh_annotations):
-                    landmarks = self.get_landmarks(frame_idx, face_idx, face, [pnt_x, pnt_y],
-                                                   refresh=True)
+                    landmarks = self.get_landmarks(frame_idx, face_idx, face, [pnt_x, pnt_y])
                     self._locate_mesh(mesh_ids, landmarks)
 
     def _discard_tk_faces(self) -> None:
@@ -222,6 +229,12 @@ class Viewport():
         :class:`TKFace`
             An object for displaying in the faces viewer canvas populated with the aligned mesh
             landmarks and face thumbnail
+
+        Notes
+        -----
+        Faces in the active frame are regenerated on every call. If the face is already cached
+        then its existing :class:`tkinter.PhotoImage` is updated in place rather than a new image
+        being created.
         """
         is_active = frame_index == self._active_frame.frame_index
         key = "_".join([str(frame_index), str(face_index)])
@@ -242,8 +255,12 @@ class Viewport():
                                     size=self.face_size,
                                     is_aligned=True).face
             assert image is not None
-            tk_face = self._get_tk_face_object(face, image, is_active)
-            self._tk_faces[key] = tk_face
+            if key in self._tk_faces:
+                tk_face = self._tk_faces[key]
+                tk_face.update(image, self._get_face_mask(face, is_active))
+            else:
+                tk_face = self._get_tk_face_object(face, image, is_active)
+                self._tk_faces[key] = tk_face
         else:
             logger.trace("tk_face exists: %s", key)  # type:ignore[attr-defined]
             tk_face = self._tk_faces[key]
@@ -274,13 +291,30 @@ class Viewport():
             An object for displaying in the faces viewer canvas populated with the aligned face
             image with a mask applied, if required.
         """
-        get_mask = (self._canvas.optional_annotations["mask"] or
-                    (is_active and self.selected_editor == "mask"))
-        mask = self._obtain_mask(face, self._canvas.selected_mask) if get_mask else None
-        tk_face = TKFace(image, size=self.face_size, mask=mask)
+        tk_face = TKFace(image, size=self.face_size, mask=self._get_face_mask(face, is_active))
         logger.trace("face: %s, tk_face: %s", face, tk_face)  # type:ignore[attr-defined]
         return tk_face
 
+    def _get_face_mask(self, face: DetectedFace, is_active: bool) -> np.ndarray | None:
+        """ Obtain the mask to display on a face, if one is required.
+
+        Parameters
+        ----------
+        face: :class:`lib.align.DetectedFace`
+            A detected face object to obtain the mask from
+        is_active: bool
+            ``True`` if the face in the currently active frame otherwise ``False``
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or ``None``
+            The selected mask for the face if masks are being displayed, otherwise ``None``
+        """
+        get_mask = (self._canvas.optional_annotations["mask"] or
+                    (is_active and self.selected_editor == "mask"))
+        return (self._obtain_mask(face, self._canvas.selected_mask, is_active=is_active)
+                if get_mask else None)
+
     def get_landmarks(self,
                       frame_index: int,
                       face_index: int,
@@ -291,8 +325,10 @@ class Viewport():
         """ Obtain the landmark points for each mesh annotation.
 
         First tries to obtain the aligned landmarks from the cache. If the landmarks do not exist
-        in the cache, or a refresh has been requested, then the landmarks are calculated from the
-        detected face object.
+        in the cache, the face's landmarks have changed since they were cached, or a refresh has
+        been requested, then the landmarks are calculated from the detected face object. The
+        aligned landmarks are cached without the viewport offset, so they remain valid when the
+        face moves within the viewport.
 
         Parameters
         ----------
@@ -316,17 +352,20 @@ class Viewport():
             part of the mesh annotation, from the top left corner location.
         """
         key = f"{frame_index}_{face_index}"
-        landmarks = self._landmarks.get(key, None)
-        if not landmarks or refresh:
+        cached = self._landmarks.get(key, None)
+        if refresh or cached is None or not np.array_equal(cached[0], face.landmarks_xy):
             aligned = AlignedFace(face.landmarks_xy,
                                   centering=self._centering,
                                   size=self.face_size)
-            landmarks = {"polygon": [], "line": []}
-            for start, end, fill in LANDMARK_PARTS[aligned.landmark_type].values():
-                points = aligned.landmarks[start:end] + top_left
-                shape: T.Literal["polygon", "line"] = "polygon" if fill else "line"
-                landmarks[shape].append(points)
-            self._landmarks[key] = landmarks
+            cached = (face.landmarks_xy.copy(), aligned.landmarks, aligned.landmark_type)
+            self._landmarks[key] = cached
+
+        landmarks: dict[T.Literal["polygon", "line"], list[np.ndarray]] = {
+            "polygon": [], "line": []}
+        all_points = cached[1] + top_left  # Offset once and store views of each part
+        for start, end, fill in LANDMARK_PARTS[cached[2]].values():
+            shape: T.Literal["polygon", "line"] = "polygon" if fill else "line"
+            landmarks[shape].append(all_points[start:end])
         return landmarks
 
     def _locate_mesh(self, mesh_ids, landmarks):
@@ -343,7 +382,7 @@ class Viewport():
             if key not in mesh_ids:
                 continue
             for coords, mesh_id in zip(area, mesh_ids[key]):
-                self._canvas.coords(mesh_id, *coords.flatten())
+                self._canvas.coords(mesh_id, *coords.ravel().tolist())
 
     def face_from_point(self, point_x: int, point_y: int) -> np.ndarray:
         """ Given an (x, y) point on the :class:`Viewport`, obtain the face information at that
@@ -398,6 +437,7 @@ class Recycler:
         self._canvas = canvas
         self._assets: dict[T.Literal["image", "line", "polygon"],
                            list[int]] = {"image": [], "line": [], "polygon": []}
+        self._asset_types: dict[int, T.Literal["image", "line", "polygon"]] = {}
         self._mesh_methods: dict[T.Literal["line", "polygon"],
                                  T.Callable] = {"line": canvas.create_line,
                                                 "polygon": canvas.create_polygon}
@@ -412,8 +452,7 @@ class Recycler:
         """
         logger.trace("Recycling %s objects", len(asset_ids))  # type:ignore[attr-defined]
         for asset_id in asset_ids:
-            asset_type = self._canvas.type(asset_id)
-            assert asset_type in self._assets
+            asset_type = self._asset_types[asset_id]
             coords = (0, 0, 0, 0) if asset_type == "line" else (0, 0)
             self._canvas.coords(asset_id, *coords)
 
@@ -444,6 +483,7 @@ class Recycler:
             retval = self._canvas.create_image(*coordinates,
                                                anchor=tk.NW,
                                                tags=["viewport", "viewport_image"])
+            self._asset_types[retval] = "image"
             logger.trace("Created new image: %s", retval)  # type:ignore[attr-defined]
         return retval
 
@@ -477,6 +517,7 @@ class Recycler:
                 coords = (0, 0) if asset_type == "polygon" else (0, 0, 0, 0)
                 tags = ["viewport", "viewport_mesh", f"viewport_{asset_type}"]
                 asset_id = self._mesh_methods[asset_type](coords, width=1, tags=tags, **kwargs)
+                self._asset_types[asset_id] = asset_type
                 logger.trace("Created new mesh %s: %s",  # type:ignore[attr-defined]
                              asset_type, asset_id)
 
@@ -710,7 +751,7 @@ class TKFace():
         if face.ndim == 2 and face.shape[1] == 1:
             self._face = self._image_from_jpg(face)
         else:
-            self._face = face[..., 2::-1]
+            self._face = cv2.cvtColor(face, cv2.COLOR_BGR2RGB)
         self._photo = ImageTk.PhotoImage(self._generate_tk_face_data(mask))
 
         logger.trace("Initialized %s", self.__class__.__name__)  # type:ignore[attr-defined]
@@ -723,7 +764,7 @@ class TKFace():
         return self._photo
 
     # << PUBLIC METHODS >> #
-    def update(self, face: np.ndarray, mask: np.ndarray) -> None:
+    def update(self, face: np.ndarray, mask: np.ndarray | None) -> None:
         """ Update the :attr:`photo` with the given face and mask.
 
         Parameters
@@ -733,7 +774,7 @@ class TKFace():
         mask: :class:`numpy.ndarray` or ``None``
             The mask to be applied to the face image. Pass ``None`` if no mask is to be used
         """
-        self._face = face[..., 2::-1]
+        self._face = cv2.cvtColor(face, cv2.COLOR_BGR2RGB)
         self._photo.paste(self._generate_tk_face_data(mask))
 
     def update_mask(self, mask: np.ndarray | None) -> None:
@@ -748,7 +789,7 @@ class TKFace():
 
     # << PRIVATE METHODS >> #
     def _image_from_jpg(self, face: np.ndarray) -> np.ndarray:
-        """ Convert an encoded jpg into 3 channel BGR image.
+        """ Convert an encoded jpg into 3 channel RGB image.
 
         Parameters
         ----------
@@ -758,13 +799,13 @@ class TKFace():
         Returns
         -------
         :class:`numpy.ndarray`
-            The decoded jpg as a 3 channel BGR image
+            The decoded jpg as a 3 channel RGB image
         """
         face = cv2.imdecode(face, cv2.IMREAD_UNCHANGED)
         interp = cv2.INTER_CUBIC if face.shape[0] < self._size else cv2.INTER_AREA
         if face.shape[0] != self._size:
             face = cv2.resize(face, (self._size, self._size), interpolation=interp)
-        return face[..., 2::-1]
+        return cv2.cvtColor(face, cv2.COLOR_BGR2RGB, dst=face)
 
     def _generate_tk_face_data(self, mask: np.ndarray | None) -> tk.PhotoImage:
         """ Create the :class:`tkinter.PhotoImage` from the currant :attr:`_face`.
@@ -779,8 +820,10 @@ class TKFace():
         :class:`tkinter.PhotoImage`
             The face formatted for the  :class:`~tools.manual.faceviewer.frame.FacesViewer` canvas.
         """
-        mask = np.ones(self._face.shape[:2], dtype="uint8") * 255 if mask is None else mask
-        if mask.shape[0] != self._size:
-            mask = cv2.resize(mask, self._face.shape[:2], interpolation=cv2.INTER_AREA)
-        img = np.concatenate((self._face, mask[..., None]), axis=-1)
+        img = cv2.cvtColor(self._face, cv2.COLOR_RGB2RGBA)
+        if mask is not None:
+            if mask.shape[0] != self._size:
+                interp = cv2.INTER_LINEAR if mask.shape[0] < self._size else cv2.INTER_AREA
+                mask = cv2.resize(mask, self._face.shape[:2], interpolation=interp)
+            img[..., 3] = mask
         return Image.fromarray(img)
@@ -7,6 +7,7 @@ import tkinter as tk
 
 import cv2
 import numpy as np
+import PIL
 from PIL import Image, ImageTk
 
 from lib.align import AlignedFace
@@ -159,12 +160,19 @@ class Navigation():
 
 class BackgroundImage():
     """ The background image of the canvas """
+    _umat_min_pixels = 3840 * 2160
+    """ int: The minimum number of pixels in a source frame for it to be resized with OpenCL """
+    _pil_downscale = ".post" in PIL.__version__
+    """ bool: ``True`` if Pillow-SIMD is installed, in which case its vectorized resize is used
+    in place of OpenCV's for downscaling frames. Stock Pillow is slower than OpenCV, so is not
+    used """
+
     def __init__(self, canvas):
         self._canvas = canvas
         self._globals = canvas._globals
         self._det_faces = canvas._det_faces
         placeholder = np.ones((*reversed(self._globals.frame_display_dims), 3), dtype="uint8")
-        self._tk_frame = ImageTk.PhotoImage(Image.fromarray(placeholder))
+        self._tk_frame = ImageTk.PhotoImage(Image.fromarray(placeholder).convert("RGBA"))
         self._tk_face = ImageTk.PhotoImage(Image.fromarray(placeholder))
         self._image = self._canvas.create_image(self._globals.frame_display_dims[0] / 2,
                                                 self._globals.frame_display_dims[1] / 2,
@@ -172,6 +180,13 @@ class BackgroundImage():
                                                 anchor=tk.CENTER,
                                                 tags="main_image")
         self._zoomed_centering = "face"
+        self._frame_buffer = np.zeros((1, 1, 4), dtype="uint8")
+        self._frame_buffer_dims = ((0, 0), (0, 0))
+        self._resize_buffer = np.zeros((1, 1, 3), dtype="uint8")
+        self._use_umat = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        self._tk_frame_source = None
+        logger.debug("Resize large frames with OpenCL: %s, downscale frames with Pillow-SIMD: %s",
+                     self._use_umat, self._pil_downscale)
 
     @property
     def _current_view_mode(self):
@@ -217,6 +232,7 @@ class BackgroundImage():
         padding = self._get_padding((min(self._globals.frame_display_dims),
                                      min(self._globals.frame_display_dims)))
         face = cv2.copyMakeBorder(face, *padding, cv2.BORDER_CONSTANT)
+        cv2.cvtColor(face, cv2.COLOR_BGR2RGB, dst=face)
         if self._tk_frame.height() != face.shape[0]:
             self._resize_frame()
 
@@ -229,7 +245,7 @@ class BackgroundImage():
         Returns
         -------
         :class:`numpy.ndarray`
-            The face sized to the shortest dimensions of the face viewer
+            The BGR face sized to the shortest dimensions of the face viewer
         """
         frame_idx = self._globals.frame_index
         face_idx = self._globals.face_index
@@ -250,22 +266,83 @@ class BackgroundImage():
                                centering=self._zoomed_centering,
                                size=size).face
         logger.trace("face shape: %s", face.shape)
-        return face[..., 2::-1]
+        return face
+
+    def _get_frame_buffer(self):
+        """ Obtain the buffers that the frame is resized and converted into for display.
+
+        The RGBA buffer is the size of the display window, and is only reallocated when either
+        the display window or the displayed size of the frame changes, so that the padding around
+        the frame stays opaque black.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The (`height`, `width`, 4) uint8 RGBA buffer for the display window
+        :class:`numpy.ndarray`
+            The BGR uint8 buffer that the frame is resized into prior to conversion
+        """
+        dims = (self._globals.frame_display_dims, self._globals.current_frame.display_dims)
+        if dims != self._frame_buffer_dims:
+            logger.debug("Allocating frame buffer: %s", dims)
+            self._frame_buffer = np.zeros((dims[0][1], dims[0][0], 4), dtype="uint8")
+            self._frame_buffer[..., 3] = 255
+            self._resize_buffer = np.empty((dims[1][1], dims[1][0], 3), dtype="uint8")
+            self._frame_buffer_dims = dims
+        return self._frame_buffer, self._resize_buffer
 
     def _update_tk_frame(self):
-        """ Place the currently held frame into :attr:`_tk_frame`. """
-        img = cv2.resize(self._globals.current_frame.image,
-                         self._globals.current_frame.display_dims,
-                         interpolation=self._globals.current_frame.interpolation)[..., 2::-1]
-        padding = self._get_padding(img.shape[:2])
-        if any(padding):
-            img = cv2.copyMakeBorder(img, *padding, cv2.BORDER_CONSTANT)
+        """ Place the currently held frame into :attr:`_tk_frame`.
+
+        The frame is resized into a scratch buffer and then converted to RGBA straight into the
+        centre of the display sized buffer. PIL wraps the RGBA buffer without copying, and as
+        :attr:`_tk_frame` is also RGBA, the pixels are handed to Tk without being repacked.
+
+        If Pillow-SIMD is installed then frames are downscaled with it, otherwise very large frames
+        are resized through OpenCL, if it is available, to take the resize off the CPU. Other
+        frames are resized with OpenCV.
+
+        Edits to faces trigger a full update, but do not change the frame, so if the frame and
+        display sizes are the same as those last placed into :attr:`_tk_frame` then this
+        returns having done nothing.
+        """
+        frame = self._globals.current_frame
+        source = (frame.image, frame.display_dims, self._globals.frame_display_dims)
+        if (self._tk_frame_source is not None and self._tk_frame_source[0] is source[0]
+                and self._tk_frame_source[1:] == source[1:]):
+            logger.trace("Frame unchanged. Not updating")
+            return
+        img, resized = self._get_frame_buffer()
+        top, _, left, _ = self._get_padding(frame.display_dims[::-1])
+        if self._pil_downscale and frame.interpolation == cv2.INTER_AREA:
+            # Pillow does not care about channel order, so the BGR frame can be resized directly
+            resized = np.asarray(Image.fromarray(frame.image).resize(frame.display_dims,
+                                                                     Image.BICUBIC))
+        elif self._use_umat and np.prod(frame.image.shape[:2]) >= self._umat_min_pixels:
+            resized = cv2.resize(cv2.UMat(frame.image),
+                                 frame.display_dims,
+                                 interpolation=frame.interpolation).get()
+        else:
+            cv2.resize(frame.image,
+                       frame.display_dims,
+                       dst=resized,
+                       interpolation=frame.interpolation)
+        cv2.cvtColor(resized,
+                     cv2.COLOR_BGR2RGBA,
+                     dst=img[top:top + frame.display_dims[1], left:left + frame.display_dims[0]])
         logger.trace("final shape: %s", img.shape)
 
         if self._tk_frame.height() != img.shape[0]:
             self._resize_frame()
 
-        self._tk_frame.paste(Image.fromarray(img))
+        self._tk_frame.paste(Image.frombuffer("RGBA",
+                                              (img.shape[1], img.shape[0]),
+                                              img,
+                                              "raw",
+                                              "RGBA",
+                                              0,
+                                              1))
+        self._tk_frame_source = source
 
     def _get_padding(self, size):
         """ Obtain the Left, Top, Right, Bottom padding required to place the square face or frame
@@ -292,8 +369,9 @@ class BackgroundImage():
         """
         logger.trace("Resizing video frame on resize event: %s", self._globals.frame_display_dims)
         placeholder = np.ones((*reversed(self._globals.frame_display_dims), 3), dtype="uint8")
-        self._tk_frame = ImageTk.PhotoImage(Image.fromarray(placeholder))
+        self._tk_frame = ImageTk.PhotoImage(Image.fromarray(placeholder).convert("RGBA"))
         self._tk_face = ImageTk.PhotoImage(Image.fromarray(placeholder))
+        self._tk_frame_source = None
         self._canvas.coords(self._image,
                             self._globals.frame_display_dims[0] / 2,
                             self._globals.frame_display_dims[1] / 2)
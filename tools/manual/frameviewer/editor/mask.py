@@ -295,8 +295,9 @@ class Mask(Editor):
         if len(self._tk_faces) < face_index + 1:
             logger.trace("Adding new Photo Image for face index: %s", face_index)
             self._tk_faces.append(ImageTk.PhotoImage(display_image))
-        elif self._tk_faces[face_index].width() != display_image.width:
-            logger.trace("Replacing existing Photo Image on width change for face index: %s",
+        elif (self._tk_faces[face_index].width(),
+              self._tk_faces[face_index].height()) != display_image.size:
+            logger.trace("Replacing existing Photo Image on size change for face index: %s",
                          face_index)
             self._tk_faces[face_index] = ImageTk.PhotoImage(display_image)
         else:
@@ -510,9 +511,9 @@ class Mask(Editor):
             t_points = np.rint((points - offset) * scale).astype("int32").squeeze()
         else:
             scale = self._internal_size / self._meta["mask_roi_size"][face_index]
-            t_points = np.expand_dims(points - self._canvas.offset, axis=0)
-            t_points = cv2.transform(t_points, self._meta["affine_matrix"][face_index]).squeeze()
-            t_points = np.rint(t_points).astype("int32")
+            matrix = self._meta["affine_matrix"][face_index]
+            t_points = (points - self._canvas.offset) @ matrix[:, :2].T + matrix[:, 2]
+            t_points = np.rint(t_points).astype("int32").squeeze()
         logger.trace("original points: %s, transformed points: %s, scale: %s",
                      points, t_points, scale)
         return t_points, scale
@@ -43,6 +43,8 @@ class DisplayFrame(ttk.Frame):  # pylint:disable=too-many-ancestors
         self._globals = tk_globals
         self._det_faces = detected_faces
         self._optional_widgets = {}
+        self._is_scrubbing = False
+        self._pending_frame_load = None
 
         self._actions_frame = ActionsFrame(self)
         main_frame = ttk.Frame(self)
@@ -164,11 +166,46 @@ class DisplayFrame(ttk.Frame):  # pylint:disable=too-many-ancestors
                         to=max_frame,
                         command=cmd)
         nav.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        nav.bind("<ButtonPress-1>", lambda e: self._set_scrubbing(True), add="+")
+        nav.bind("<ButtonRelease-1>", lambda e: self._set_scrubbing(False), add="+")
         self._globals.var_transport_index.trace_add("write", self._set_frame_index)
         return {"entry": tbox, "scale": nav, "label": lbl}
 
+    def _set_scrubbing(self, is_scrubbing):
+        """ Set whether the user is currently dragging the navigation slider.
+
+        On release of the slider, any frame load that is still pending is performed immediately.
+
+        Parameters
+        ----------
+        is_scrubbing: bool
+            ``True`` if the slider has been pressed, ``False`` if it has been released
+        """
+        logger.trace("Setting scrubbing to %s", is_scrubbing)
+        self._is_scrubbing = is_scrubbing
+        if not is_scrubbing and self._pending_frame_load is not None:
+            self.after_cancel(self._pending_frame_load)
+            self._pending_frame_load = None
+            self._set_frame_index()
+
+    def _load_scrubbed_frame(self, frame_index):
+        """ Load the frame that the navigation slider was last dragged to once Tk is idle.
+
+        Parameters
+        ----------
+        frame_index: int
+            The frame index to load
+        """
+        self._pending_frame_load = None
+        self._globals.var_frame_index.set(frame_index)
+
     def _set_frame_index(self, *args):  # pylint:disable=unused-argument
-        """ Set the actual frame index based on current slider position and filter mode. """
+        """ Set the actual frame index based on current slider position and filter mode.
+
+        Whilst the slider is being dragged, the frame is not loaded for every position that it
+        passes through. Instead the load is deferred until Tk has processed all of the queued
+        slider events, so only the latest position is loaded.
+        """
         try:
             slider_position = self._globals.var_transport_index.get()
         except TclError:
@@ -180,6 +217,11 @@ class DisplayFrame(ttk.Frame):  # pylint:disable=too-many-ancestors
             self._globals.var_transport_index.set(actual_position)
         frame_idx = frames[actual_position] if frames else -1
         logger.trace("slider_position: %s, frame_idx: %s", actual_position, frame_idx)
+        if self._is_scrubbing:
+            if self._pending_frame_load is not None:
+                self.after_cancel(self._pending_frame_load)
+            self._pending_frame_load = self.after_idle(self._load_scrubbed_frame, frame_idx)
+            return
         self._globals.var_frame_index.set(frame_idx)
 
     def _add_transport(self):
@@ -503,10 +545,8 @@ class ActionsFrame(ttk.Frame):  # pylint:disable=too-many-ancestors
         """ Disable or enable the static buttons """
         position = self._globals.frame_index
         face_count_per_index = self._det_faces.face_count_per_index
-        prev_exists = position != -1 and any(count != 0
-                                             for count in face_count_per_index[:position])
-        next_exists = position != -1 and any(count != 0
-                                             for count in face_count_per_index[position + 1:])
+        prev_exists = position != -1 and bool(face_count_per_index[:position].any())
+        next_exists = position != -1 and bool(face_count_per_index[position + 1:].any())
         states = {"prev": ["!disabled"] if prev_exists else ["disabled"],
                   "next": ["!disabled"] if next_exists else ["disabled"]}
         for direction in ("prev", "next"):
@@ -8,6 +8,8 @@ import sys
 import typing as T
 import tkinter as tk
 from tkinter import ttk
+from collections import OrderedDict
+from concurrent import futures
 from dataclasses import dataclass
 from time import sleep
 
@@ -80,6 +82,7 @@ class Manual(tk.Tk):
         valid_meta = all(val is not None for val in video_meta_data.values())
 
         loader = FrameLoader(self._globals,
+                             self._detected_faces,
                              arguments.frames,
                              video_meta_data,
                              self._detected_faces.frame_list)
@@ -160,8 +163,8 @@ class Manual(tk.Tk):
             if extractor_init and frames_init:
                 logger.debug("Threads inialized")
                 break
-            logger.debug("Threads not initialized. Waiting...")
-            sleep(1)
+            logger.trace("Threads not initialized. Waiting...")  # type:ignore[attr-defined]
+            sleep(0.1)
 
         extractor.link_faces(self._detected_faces)
         if not valid_meta:
@@ -654,6 +657,9 @@ class FrameLoader():
     ----------
     tk_globals: :class:`~tools.manual.manual.TkGlobals`
         The tkinter variables that apply to the whole of the GUI
+    detected_faces: :class:`~tools.manual.detected_faces.DetectedFaces`
+        The detected faces, used for reading ahead through the frames that meet the current
+        navigation filter
     frames_location: str
         The path to the input frames
     video_meta_data: dict
@@ -661,15 +667,30 @@ class FrameLoader():
     file_list: list[str]
         The list of filenames that exist within the alignments file
     """
+    _cache_size = 16
+    """ int: The maximum number of decoded frames to hold in :attr:`_frame_cache` """
+    _cache_bytes = 128 * 1024 ** 2
+    """ int: The approximate maximum memory, in bytes, for the decoded frames held in
+    :attr:`_frame_cache`. Large frames reduce the number of frames held, down to the displayed
+    frame and its prefetched neighbours """
+    _prefetch = (1, 2, -1)
+    """ tuple[int, ...]: The offsets, within the filtered frames, from the displayed frame that
+    are read in the background """
+
     def __init__(self,
                  tk_globals: TkGlobals,
+                 detected_faces: DetectedFaces,
                  frames_location: str,
                  video_meta_data: dict[str, list[int] | list[float] | None],
                  file_list: list[str]) -> None:
         logger.debug(parse_class_init(locals()))
         self._globals = tk_globals
+        self._filter = detected_faces.filter
         self._loader: SingleFrameLoader | None = None
         self._current_idx = 0
+        self._reader = futures.ThreadPoolExecutor(max_workers=1,
+                                                  thread_name_prefix=self.__class__.__name__)
+        self._frame_cache: OrderedDict[int, futures.Future] = OrderedDict()
         self._init_thread = self._background_init_frames(frames_location,
                                                          video_meta_data,
                                                          file_list)
@@ -735,13 +756,95 @@ class FrameLoader():
         """
         self._loader = SingleFrameLoader(frames_location, video_meta_data=video_meta_data)
         if not self._loader.is_video and len(frame_list) < self._loader.count:
+            frame_names = set(frame_list)
             files = [os.path.basename(f) for f in self._loader.file_list]
-            skip_list = [idx for idx, fname in enumerate(files) if fname not in frame_list]
+            skip_list = [idx for idx, fname in enumerate(files) if fname not in frame_names]
             logger.debug("Adding %s entries to skip list for images not in alignments file",
                          len(skip_list))
             self._loader.add_skip_list(skip_list)
         self._globals.set_frame_count(self._loader.process_count)
 
+    def _get_frame(self, position: int) -> tuple[str, np.ndarray]:
+        """ Obtain the frame at the given position and start reading the frames around it.
+
+        All frames are read in a single background thread into a least recently used cache, so
+        neighbouring frames are decoded whilst the GUI updates for the current one. If the
+        requested frame is not in the cache then any pending reads that have not yet started are
+        cancelled, so that it is not queued behind them. The number of frames held is limited by
+        both :attr:`_cache_size` and :attr:`_cache_bytes`.
+
+        Parameters
+        ----------
+        position: int
+            The absolute frame index to obtain
+
+        Returns
+        -------
+        filename: str
+            The filename of the frame
+        frame: :class:`numpy.ndarray`
+            The frame at the given position
+        """
+        if position not in self._frame_cache:
+            for idx in [idx for idx, future in self._frame_cache.items() if future.cancel()]:
+                del self._frame_cache[idx]
+        future = self._read_frame(position)
+
+        for frame_index in self._get_prefetch_indices(position):
+            self._read_frame(frame_index)
+        self._frame_cache.move_to_end(position)
+
+        retval = future.result()
+        cache_size = min(self._cache_size,
+                         max(len(self._prefetch) + 1, self._cache_bytes // retval[1].nbytes))
+        while len(self._frame_cache) > cache_size:
+            self._frame_cache.popitem(last=False)[1].cancel()
+        return retval
+
+    def _get_prefetch_indices(self, position: int) -> list[int]:
+        """ Obtain the frame indices to read ahead of navigation from the given frame.
+
+        These are the neighbouring frames within the currently filtered frames, so that stepping
+        or playing through a filtered view finds its frames in the cache. If the frame is not
+        within the filtered frames, then the frames either side of it are used.
+
+        Parameters
+        ----------
+        position: int
+            The absolute frame index of the frame being displayed
+
+        Returns
+        -------
+        list[int]
+            The absolute frame indices to read in the background
+        """
+        retval = self._filter.get_neighbours(position, self._prefetch)
+        if retval is None:
+            retval = [position + offset for offset in self._prefetch
+                      if 0 <= position + offset < self._globals.frame_count]
+        return retval
+
+    def _read_frame(self, position: int) -> futures.Future:
+        """ Obtain the future for reading the frame at the given position, submitting it to the
+        background reader if it is not already cached, and mark it as most recently used.
+
+        Parameters
+        ----------
+        position: int
+            The absolute frame index to read
+
+        Returns
+        -------
+        :class:`concurrent.futures.Future`
+            The future that returns the filename and frame for the given position
+        """
+        assert self._loader is not None
+        if position not in self._frame_cache:
+            self._frame_cache[position] = self._reader.submit(self._loader.image_from_index,
+                                                              position)
+        self._frame_cache.move_to_end(position)
+        return self._frame_cache[position]
+
     def _set_frame(self,  # pylint:disable=unused-argument
                    *args,
                    initialize: bool = False) -> None:
@@ -768,8 +871,7 @@ class FrameLoader():
             filename = "No Frame"
             frame = np.ones(self._globals.frame_display_dims + (3, ), dtype="uint8")
         else:
-            assert self._loader is not None
-            filename, frame = self._loader.image_from_index(position)
+            filename, frame = self._get_frame(position)
         logger.trace("filename: %s, frame: %s, position: %s",  # type:ignore[attr-defined]
                      filename, frame.shape, position)
         self._globals.set_current_frame(frame, filename)
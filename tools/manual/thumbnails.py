@@ -9,11 +9,12 @@ from dataclasses import dataclass
 from time import sleep
 from threading import Lock
 
+import cv2
 import imageio
 import numpy as np
 
 from tqdm import tqdm
-from lib.align import AlignedFace
+from lib.align import AlignedFace, transform_image
 from lib.image import SingleFrameLoader, generate_thumbnail
 from lib.multithreading import MultiThread
 
@@ -167,17 +168,18 @@ class ThumbsCreator():
         folder of images.
 
         Goes through the file list one at a time, passing each file to a separate background
-        thread for some speed up.
+        thread for some speed up. The images are split between the threads so that no thread
+        handles more than one image more than any other.
         """
         reader = SingleFrameLoader(self._location)
+        if not reader.count:
+            logger.debug("No images in folder: '%s'", self._location)
+            return
         num_threads = min(reader.count, self._num_threads)
-        frame_split = reader.count // self._num_threads
+        bounds = np.linspace(0, reader.count, num=num_threads + 1).round().astype("int64")
         logger.debug("total images: %s, num_threads: %s, frames_per_thread: %s",
-                     reader.count, num_threads, frame_split)
-        for idx in range(num_threads):
-            is_final = idx == num_threads - 1
-            start_idx = idx * frame_split
-            end_idx = reader.count if is_final else start_idx + frame_split
+                     reader.count, num_threads, np.diff(bounds).tolist())
+        for start_idx, end_idx in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
             thread = MultiThread(self._load_from_folder, reader, start_idx, end_idx)
             thread.start()
             self._threads.append(thread)
@@ -214,7 +216,7 @@ class ThumbsCreator():
         for idx, frame in enumerate(reader):
             frame_idx = idx + start_index
             filename = f"{vidname}_{frame_idx + 1:06d}{ext}"
-            self._set_thumbail(filename, frame[..., ::-1], frame_idx)
+            self._set_thumbail(filename, cv2.cvtColor(frame, cv2.COLOR_RGB2BGR), frame_idx)
             if idx == segment_count - 1:
                 # Sometimes extra frames are picked up at the end of a segment, so stop
                 # processing when segment frame count has been hit.
@@ -267,12 +269,99 @@ class ThumbsCreator():
         logger.debug("reader: %s, start_index: %s, end_index: %s",
                      reader, start_index, end_index)
         for frame_index in range(start_index, end_index):
-            filename, frame = reader.image_from_index(frame_index)
-            self._set_thumbail(filename, frame, frame_index)
+            aligned = self._get_aligned(frame_index)
+            reduction = self._get_jpg_reduction(reader.file_list[frame_index], aligned)
+            if reduction == 1:
+                filename, frame = reader.image_from_index(frame_index)
+            else:
+                filename, frame = self._read_reduced(reader.file_list[frame_index], reduction)
+            self._set_thumbail(filename, frame, frame_index, aligned=aligned, reduction=reduction)
         logger.debug("Segment complete: (start_index: %s, processed_count: %s)",
                      start_index, end_index - start_index)
 
-    def _set_thumbail(self, filename: str, frame: np.ndarray, frame_index: int) -> None:
+    def _get_aligned(self, frame_index: int) -> list[AlignedFace]:
+        """ Obtain the head centered thumbnail alignment for each face in a frame, without
+        extracting the face.
+
+        Parameters
+        ----------
+        frame_index: int
+            The frame index of the frame in the :attr:`_frame_faces`
+
+        Returns
+        -------
+        list[:class:`~lib.align.AlignedFace`]
+            The thumbnail sized aligned face objects for each face in the frame
+        """
+        return [AlignedFace(face.landmarks_xy, centering="head", size=96)
+                for face in self._frame_faces[frame_index]]
+
+    @classmethod
+    def _get_jpg_reduction(cls, full_path: str, aligned: list[AlignedFace]) -> int:
+        """ Obtain the largest factor that a jpg frame can be reduced by at decode time whilst
+        keeping at least two source pixels for each pixel of every face's thumbnail.
+
+        libjpeg can decode at 1/2, 1/4 or 1/8 scale for a fraction of the cost of a full decode,
+        so frames that only contain large faces do not need to be decoded at full size.
+
+        Parameters
+        ----------
+        full_path: str
+            The full path to the frame
+        aligned: list[:class:`~lib.align.AlignedFace`]
+            The thumbnail sized aligned face objects for each face in the frame
+
+        Returns
+        -------
+        int
+            The factor to reduce the frame by at decode time. `1` for no reduction
+        """
+        if not aligned or os.path.splitext(full_path)[-1].lower() not in (".jpg", ".jpeg"):
+            return 1
+        max_scale = max(np.hypot(*face.adjusted_matrix[0, :2]) for face in aligned)
+        retval = next((factor for factor in (8, 4, 2) if factor * max_scale <= 0.5), 1)
+        logger.trace("frame: '%s', max_scale: %s, reduction: %s",  # type:ignore[attr-defined]
+                     full_path, max_scale, retval)
+        return retval
+
+    @classmethod
+    def _read_reduced(cls, full_path: str, reduction: int) -> tuple[str, np.ndarray]:
+        """ Decode a jpg frame at a reduced size.
+
+        Parameters
+        ----------
+        full_path: str
+            The full path to the frame
+        reduction: int
+            The factor to reduce the frame by at decode time. One of `2`, `4` or `8`
+
+        Returns
+        -------
+        filename: str
+            The filename of the frame
+        frame: :class:`numpy.ndarray`
+            The reduced size frame
+
+        Raises
+        ------
+        ValueError
+            If the image could not be decoded
+        """
+        flags = {2: cv2.IMREAD_REDUCED_COLOR_2,
+                 4: cv2.IMREAD_REDUCED_COLOR_4,
+                 8: cv2.IMREAD_REDUCED_COLOR_8}
+        with open(full_path, "rb") as infile:
+            frame = cv2.imdecode(np.frombuffer(infile.read(), dtype="uint8"), flags[reduction])
+        if frame is None:
+            raise ValueError(f"Unable to open image: '{full_path}'")
+        return os.path.basename(full_path), frame
+
+    def _set_thumbail(self,
+                      filename: str,
+                      frame: np.ndarray,
+                      frame_index: int,
+                      aligned: list[AlignedFace] | None = None,
+                      reduction: int = 1) -> None:
         """ Extracts the faces from the frame and adds to alignments file
 
         Parameters
@@ -283,13 +372,24 @@ class ThumbsCreator():
             The frame that contains the faces
         frame_index: int
             The frame index of this frame in the :attr:`_frame_faces`
+        aligned: list[:class:`~lib.align.AlignedFace`], optional
+            The thumbnail sized aligned face objects for each face in the frame, if they have
+            already been generated. ``None`` to generate them. Default: ``None``
+        reduction: int, optional
+            The factor that the frame was reduced by at decode time. Default: `1`
         """
-        for face_idx, face in enumerate(self._frame_faces[frame_index]):
-            aligned = AlignedFace(face.landmarks_xy,
-                                  image=frame,
-                                  centering="head",
-                                  size=96)
-            face.thumbnail = generate_thumbnail(aligned.face, size=96)
+        aligned = self._get_aligned(frame_index) if aligned is None else aligned
+        for face_idx, (face, align) in enumerate(zip(self._frame_faces[frame_index], aligned)):
+            matrix = align.matrix
+            if reduction != 1:
+                # Each reduced pixel is the average of a (reduction x reduction) block of pixels,
+                # so map the reduced frame's pixel centers back into the full frame
+                offset = (reduction - 1) / 2
+                matrix = matrix @ np.array([[reduction, 0., offset],
+                                            [0., reduction, offset],
+                                            [0., 0., 1.]])
+            face.thumbnail = generate_thumbnail(transform_image(frame, matrix, 96, align.padding),
+                                                size=96)
             assert face.thumbnail is not None
             self._alignments.thumbnails.add_thumbnail(filename, face_idx, face.thumbnail)
         with self._pbar.lock:
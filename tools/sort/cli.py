@@ -201,6 +201,21 @@ class SortArgs(FaceSwapArgs):
                 "increment. Folder 0 will contain faces looking the most to the left/down whereas "
                 "the last folder will contain the faces looking the most to the right/up. NB: "
                 "Some bins may be empty if faces do not fit the criteria. \nDefault value: 5")})
+        argument_list.append({
+            "opts": ('-c', '--cache-histograms'),
+            "action": 'store_true',
+            "dest": 'cache_histograms',
+            "group": _("settings"),
+            "default": False,
+            "help": _(
+                "Only used by the 'hist' and 'hist-dissim' methods. Store the histogram of each "
+                "face in a hidden '.faceswap_sort_cache.npz' file in the input directory, so that "
+                "subsequent runs over the same folder only need to read new or changed faces. The "
+                "cache file is only written when 'keep' is selected, as otherwise the original "
+                "files are moved or renamed. The file can be safely deleted at any time. NB: The "
+                "cache is only used when the histogram method is the only method selected (the "
+                "other of sort-by and group-by is 'none' or the same method). It has no effect "
+                "when sorting by one method and grouping by another.")})
         argument_list.append({
             "opts": ('-l', '--log-changes'),
             "action": 'store_true',
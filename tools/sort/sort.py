@@ -9,7 +9,7 @@ import sys
 import typing as T
 
 from argparse import Namespace
-from shutil import copyfile, rmtree
+from shutil import copyfile, move, rmtree
 
 from tqdm import tqdm
 
@@ -124,6 +124,7 @@ class _Sort():
                            "color_orange": SortColor}
 
         self._args = self._parse_arguments(arguments)
+        self._transfer = copyfile if self._args.keep_original else move
         self._changes: dict[str, str] = {}
         self.serializer: Serializer | None = None
 
@@ -222,6 +223,10 @@ class _Sort():
 
             retval = sorter
 
+        if self._args.cache_histograms and not isinstance(retval, SortHistogram):
+            logger.warning("Histograms are only cached when sorting and/or grouping by a single "
+                           "histogram method. '--cache-histograms' will be ignored.")
+
         logger.debug("Final sorter: %s", retval)
         return retval
 
@@ -260,10 +265,7 @@ class _Sort():
             The full path to where the source file should be moved/renamed
         """
         try:
-            if self._args.keep_original:
-                copyfile(source, destination)
-            else:
-                os.rename(source, destination)
+            self._transfer(source, destination)
         except FileNotFoundError as err:
             logger.error("Failed to sort '%s' to '%s'. Original error: %s",
                          source, destination, str(err))
@@ -293,24 +295,27 @@ class _Sort():
         description = f"{'Copying' if self._args.keep_original else 'Moving'} into groups"
         description += " and renaming" if is_rename else ""
 
-        pbar = tqdm(range(len(self._sorter.sorted_filelist)),
-                    desc=description,
-                    file=sys.stdout,
-                    leave=False)
         idx = 0
-        for bin_id, bin_ in enumerate(self._sorter.binned):
-            pbar.set_description(f"{description}: Bin {bin_id + 1} of {len(self._sorter.binned)}")
-            output_path = os.path.join(self._args.output_dir, bin_names[bin_id])
-            if not bin_:
-                logger.debug("Removing empty bin: %s", output_path)
-                os.rmdir(output_path)
-            for source in bin_:
-                basename = os.path.basename(source)
-                dst_name = f"{idx:06d}_{basename}" if is_rename else basename
-                dest = os.path.join(output_path, dst_name)
-                self._sort_file(source, dest)
-                idx += 1
-                pbar.update(1)
+        with tqdm(total=len(self._sorter.sorted_filelist),
+                  desc=description,
+                  file=sys.stdout,
+                  leave=False) as pbar:
+            for bin_id, bin_ in enumerate(self._sorter.binned):
+                # Don't force a redraw for every bin. Grouping can output thousands of bins
+                pbar.set_description(
+                    f"{description}: Bin {bin_id + 1} of {len(self._sorter.binned)}",
+                    refresh=False)
+                output_path = os.path.join(self._args.output_dir, bin_names[bin_id])
+                if not bin_:
+                    logger.debug("Removing empty bin: %s", output_path)
+                    os.rmdir(output_path)
+                for source in bin_:
+                    basename = os.path.basename(source)
+                    dst_name = f"{idx:06d}_{basename}" if is_rename else basename
+                    dest = os.path.join(output_path, dst_name)
+                    self._sort_file(source, dest)
+                    idx += 1
+                    pbar.update(1)
 
     # Output methods
     def _output_non_grouped(self) -> None:
@@ -7,17 +7,21 @@ sorting a full list of scores and binning based on those sorted scores.
 from __future__ import annotations
 import logging
 import operator
+import os
 import sys
 import typing as T
 
+from collections import deque
 from collections.abc import Generator
+from concurrent import futures
 
 import cv2
 import numpy as np
 from tqdm import tqdm
 
 from lib.align import AlignedFace, DetectedFace, LandmarkType
-from lib.image import FacesLoader, ImagesLoader, read_image_meta_batch, update_existing_metadata
+from lib.image import (FacesLoader, ImagesLoader, read_image, read_image_meta_batch,
+                       update_existing_metadata)
 from lib.utils import FaceswapError
 from plugins.extract.recognition.vgg_face2 import Cluster, Recognition as VGGFace
 
@@ -54,6 +58,7 @@ class InfoLoader():
         self._iterator = None
         self._description = "Reading image statistics..."
         self._loader = ImagesLoader(input_dir) if info_type == "face" else FacesLoader(input_dir)
+        self._file_list: list[str] = self._loader.file_list
         self._cached_source_data: dict[str, PNGHeaderSourceDict] = {}
         if self._loader.count == 0:
             logger.error("No images to process in location: '%s'", input_dir)
@@ -66,6 +71,23 @@ class InfoLoader():
         """ int: The number of files to be processed """
         return len(self._loader.file_list)
 
+    @property
+    def file_list(self) -> list[str]:
+        """ list[str]: Full path to every file in the input folder, in processing order """
+        return self._loader.file_list
+
+    def exclude_files(self, filenames: set[str]) -> None:
+        """ Exclude files from being read by the iterator, for example when a sort method already
+        holds their results.
+
+        Parameters
+        ----------
+        filenames: set[str]
+            Full path to the files that should not be read
+        """
+        self._file_list = [fname for fname in self._loader.file_list if fname not in filenames]
+        logger.debug("Excluded %s files. Files to read: %s", len(filenames), len(self._file_list))
+
     def _get_iterator(self) -> ImgMetaType:
         """ Obtain the iterator for the selected :attr:`info_type`.
 
@@ -135,8 +157,8 @@ class InfoLoader():
         alignments: dict or ``None``
             The alignment data for the given face or ``None`` if no alignments found
         """
-        for filename, metadata in tqdm(read_image_meta_batch(self._loader.file_list),
-                                       total=self._loader.count,
+        for filename, metadata in tqdm(read_image_meta_batch(self._file_list),
+                                       total=len(self._file_list),
                                        desc=self._description,
                                        leave=False):
             alignments = self._get_alignments(filename, metadata.get("itxt", {}))
@@ -154,9 +176,9 @@ class InfoLoader():
         alignments: dict or ``None``
             The alignment data for the given face or ``None`` if no alignments found
         """
-        for filename, image, metadata in tqdm(self._loader.load(),
+        for filename, image, metadata in tqdm(self._threaded_reader(with_metadata=True),
                                               desc=self._description,
-                                              total=self._loader.count,
+                                              total=len(self._file_list),
                                               leave=False):
             alignments = self._get_alignments(filename, metadata)
             yield filename, image, alignments
@@ -173,12 +195,114 @@ class InfoLoader():
         alignments: ``None``
             Alignments will always be ``None`` with the image data reader
         """
-        for filename, image in tqdm(self._loader.load(),
-                                    desc=self._description,
-                                    total=self._loader.count,
-                                    leave=False):
+        for filename, image, _ in tqdm(self._threaded_reader(with_metadata=False),
+                                       desc=self._description,
+                                       total=len(self._file_list),
+                                       leave=False):
             yield filename, image, None
 
+    def _threaded_reader(self, with_metadata: bool
+                         ) -> Generator[tuple[str, np.ndarray, dict[str, T.Any]], None, None]:
+        """ Decode the images in :attr:`_loader` file list in a thread pool.
+
+        Image decoding releases the GIL, so reading on several threads keeps the cores busy
+        whilst the sort method scores each image in the main thread. Images are yielded in file
+        list order and only a limited number are decoded ahead of the consumer, to bound memory
+        use. Images that fail to load are skipped.
+
+        Parameters
+        ----------
+        with_metadata: bool
+            ``True`` to read the Faceswap metadata from the PNG header along with the image
+
+        Yields
+        ------
+        filename: str
+            The filename that has been read
+        image: :class:`numpy.ndarray`
+            The image loaded from disk
+        metadata: dict
+            The Faceswap metadata from the PNG header if requested, otherwise an empty dict
+        """
+        num_workers = os.cpu_count() or 1
+        file_list = self._file_list
+        lookahead = num_workers * 8
+        for filename in file_list[:lookahead]:
+            self._prefetch(filename)
+
+        pending: deque[tuple[str, futures.Future]] = deque()
+        with futures.ThreadPoolExecutor(max_workers=num_workers,
+                                        thread_name_prefix=self.__class__.__name__) as executor:
+            for idx, filename in enumerate(file_list):
+                if idx + lookahead < len(file_list):
+                    self._prefetch(file_list[idx + lookahead])
+                pending.append((filename, executor.submit(read_image,
+                                                          filename,
+                                                          raise_error=True,
+                                                          with_metadata=with_metadata)))
+                if len(pending) < num_workers * 2:
+                    continue
+                retval = self._get_read_result(*pending.popleft(), with_metadata)
+                if retval is not None:
+                    yield retval
+            while pending:
+                retval = self._get_read_result(*pending.popleft(), with_metadata)
+                if retval is not None:
+                    yield retval
+
+    @classmethod
+    def _prefetch(cls, filename: str) -> None:
+        """ Ask the kernel to start reading a file into the page cache ahead of it being decoded,
+        so that disk reads for upcoming files overlap with decoding the current ones. Does
+        nothing on platforms without ``posix_fadvise``.
+
+        Parameters
+        ----------
+        filename: str
+            Full path to the file that will be read shortly
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            fd = os.open(filename, os.O_RDONLY)
+        except OSError:
+            return  # Any error is reported when the file is read
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _get_read_result(cls, filename: str, future: futures.Future, with_metadata: bool
+                         ) -> tuple[str, np.ndarray, dict[str, T.Any]] | None:
+        """ Obtain the result of a threaded image read.
+
+        Parameters
+        ----------
+        filename: str
+            The filename that has been read
+        future: :class:`concurrent.futures.Future`
+            The future for the read task
+        with_metadata: bool
+            ``True`` if the Faceswap metadata was read with the image
+
+        Returns
+        -------
+        tuple or ``None``
+            The filename, image and metadata (empty dict if not read) or ``None`` if the image
+            could not be loaded
+        """
+        try:
+            result = future.result()
+        except Exception:  # pylint:disable=broad-except
+            logger.warning("Face not loaded: '%s'", filename)
+            return None
+        if with_metadata:
+            return filename, result[0], result[1]
+        return filename, result, {}
+
     def update_png_header(self, filename: str, alignments: PNGHeaderAlignmentsDict) -> None:
         """ Update the PNG header of the given file with the given alignments.
 
@@ -588,6 +712,31 @@ class SortBlur(SortMethod):
         super().__init__(arguments, loader_type="all", is_group=is_group)
         method = arguments.group_method if self._is_group else arguments.sort_method
         self._use_fft = method == "blur_fft"
+        self._buffers: dict[str, np.ndarray] = {}
+
+    def _get_buffer(self, name: str, shape: tuple[int, ...], dtype: str) -> np.ndarray:
+        """ Obtain a reusable output array for OpenCV, so that a new array is not allocated for
+        every image. Faces are generally all the same size, so the array is only reallocated
+        when the shape changes.
+
+        Parameters
+        ----------
+        name: str
+            The name of the buffer to obtain
+        shape: tuple[int, ...]
+            The required shape of the buffer
+        dtype: str
+            The required data type of the buffer
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The uninitialized buffer
+        """
+        retval = self._buffers.get(name)
+        if retval is None or retval.shape != shape or retval.dtype != dtype:
+            retval = self._buffers[name] = np.empty(shape, dtype=dtype)
+        return retval
 
     def estimate_blur(self, image: np.ndarray, alignments=None) -> float:
         """ Estimate the amount of blur an image has with the variance of the Laplacian.
@@ -610,9 +759,16 @@ class SortBlur(SortMethod):
         if alignments is not None:
             image = self._mask_face(image, alignments)
         if image.ndim == 3:
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        blur_map = cv2.Laplacian(image, cv2.CV_32F)
-        score = np.var(blur_map) / np.sqrt(image.shape[0] * image.shape[1])
+            image = cv2.cvtColor(image,
+                                 cv2.COLOR_BGR2GRAY,
+                                 dst=self._get_buffer("gray", image.shape[:2], image.dtype.name))
+        blur_map = cv2.Laplacian(image,
+                                 cv2.CV_32F,
+                                 dst=self._get_buffer("laplacian", image.shape, "float32")).ravel()
+        # Variance as E[x²] - E[x]², which avoids np.var's full size temporary arrays
+        mean = blur_map.mean(dtype="float64")
+        variance = float(np.dot(blur_map, blur_map)) / blur_map.size - mean * mean
+        score = variance / np.sqrt(image.shape[0] * image.shape[1])
         return score
 
     def estimate_blur_fft(self,
@@ -679,12 +835,13 @@ class SortBlur(SortMethod):
             self._log_once = False
 
         estimator = self.estimate_blur_fft if self._use_fft else self.estimate_blur
-        self._result.append((filename, estimator(image, alignments)))
+        # Python floats sort much faster than numpy scalars
+        self._result.append((filename, float(estimator(image, alignments))))
 
     def sort(self) -> None:
         """ Sort by metric score. Order in reverse for distance sort. """
         logger.info("Sorting...")
-        self._result = sorted(self._result, key=operator.itemgetter(1), reverse=True)
+        self._result.sort(key=operator.itemgetter(1), reverse=True)
 
     def binning(self) -> list[list[str]]:
         """ Create bins to split linearly from the lowest to the highest sample value
@@ -808,29 +965,12 @@ class SortColor(SortMethod):
         else:
             channel_to_sort = self._desired_channel[self._method]
             score = np.average(self._convert_color(image), axis=(0, 1))[channel_to_sort]
-        self._result.append((filename, score))
+        self._result.append((filename, float(score)))
 
     def sort(self) -> None:
-        """ Sort by metric score. Order in reverse for distance sort. """
-        if self._method == "black":
-            self._sort_black_pixels()
-            return
-        self._result = sorted(self._result, key=operator.itemgetter(1), reverse=True)
-
-    def _sort_black_pixels(self) -> None:
-        """ Sort by percentage of black pixels
-
-         Calculates the sum of black pixels, gets the percentage X 3 channels
-        """
-        img_list_len = len(self._result)
-        for i in tqdm(range(0, img_list_len - 1),
-                      desc="Comparing black pixels", file=sys.stdout,
-                      leave=False):
-            for j in range(0, img_list_len-i-1):
-                if self._result[j][1] > self._result[j+1][1]:
-                    temp = self._result[j]
-                    self._result[j] = self._result[j+1]
-                    self._result[j+1] = temp
+        """ Sort by metric score. Order in reverse for distance sort. Percentage of black pixels
+        is sorted in ascending order. """
+        self._result.sort(key=operator.itemgetter(1), reverse=self._method != "black")
 
 
 class SortFace(SortMethod):
@@ -968,112 +1108,300 @@ class SortHistogram(SortMethod):
         Set to ``True`` if this class is going to be called exclusively for binning.
         Default: ``False``
     """
+    _cache_name = ".faceswap_sort_cache.npz"
+    _block_size = 2 ** 24  # The maximum number of histogram comparisons to hold in memory at once
+
     def __init__(self, arguments: Namespace, is_group: bool = False) -> None:
         super().__init__(arguments, loader_type="all", is_group=is_group)
         method = arguments.group_method if self._is_group else arguments.sort_method
-        self._is_dissim = method == "hist-dissim"
+        self._is_dissim = method == "hist_dissim"
         self._threshold: float = 0.3 if arguments.threshold < 0.0 else arguments.threshold
+        self._histograms: np.ndarray | None = None
+        self._cache_file = (os.path.join(arguments.input_dir, self._cache_name)
+                            if arguments.cache_histograms else None)
+        # Moved or renamed files would leave the cache describing files that no longer exist
+        self._save_to_cache = arguments.keep_original
+
+    def _next_histogram(self) -> np.ndarray:
+        """ Obtain the next free row of :attr:`_histograms` for storing a face's histogram.
+
+        The buffer is allocated for the full file list on first call, so that each histogram
+        does not need its own allocation.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The (256, ) float32 row of :attr:`_histograms` for the next item in :attr:`_result`
+        """
+        if self._histograms is None:
+            self._histograms = np.empty((self._iterator.filelist_count, 256), dtype="float32")
+            logger.debug("Allocated histogram buffer: %s", self._histograms.shape)
+        return self._histograms[len(self._result)]
+
+    def _load_cache(self, mtimes: dict[str, float]) -> None:
+        """ Load the histograms stored by a previous run from the input folder's cache file.
+
+        Histograms are only taken for files whose modification time is unchanged since they were
+        cached. These are added to :attr:`_result` and excluded from the image loader. Any error
+        reading the cache means that every file is read.
+
+        Parameters
+        ----------
+        mtimes: dict[str, float]
+            The full path to each file in the input folder with its modification time
+        """
+        assert self._cache_file is not None
+        if not os.path.isfile(self._cache_file):
+            return
+        try:
+            with np.load(self._cache_file) as cache:
+                cached = {str(fname): (float(mtime), hist)
+                          for fname, mtime, hist in zip(cache["filenames"],
+                                                        cache["mtimes"],
+                                                        cache["histograms"])}
+        except Exception as err:  # pylint:disable=broad-except
+            logger.debug("Could not load histogram cache '%s': %s", self._cache_file, str(err))
+            return
+
+        for filename, mtime in mtimes.items():
+            entry = cached.get(os.path.basename(filename))
+            if entry is None or entry[0] != mtime:
+                continue
+            row = self._next_histogram()
+            row[:] = entry[1]
+            self._result.append((filename, row))
+
+        self._iterator.exclude_files(set(r[0] for r in self._result))
+        logger.debug("Loaded %s histograms from cache '%s'", len(self._result), self._cache_file)
+
+    def _save_cache(self, mtimes: dict[str, float]) -> None:
+        """ Save the collected histograms to the input folder's cache file, so that subsequent
+        runs over the same folder only need to read new or changed files.
+
+        The cache is only written when the original files are being kept in place.
+
+        Parameters
+        ----------
+        mtimes: dict[str, float]
+            The full path to each file in the input folder with its modification time
+        """
+        assert self._cache_file is not None
+        if not self._result:
+            return
+        if not self._save_to_cache:
+            logger.debug("Files are being moved. Not saving histogram cache")
+            return
+        try:
+            np.savez(self._cache_file,
+                     filenames=np.array([os.path.basename(r[0]) for r in self._result]),
+                     mtimes=np.array([mtimes[r[0]] for r in self._result], dtype="float64"),
+                     histograms=np.stack([T.cast(np.ndarray, r[1]) for r in self._result]))
+        except OSError as err:
+            logger.debug("Could not save histogram cache '%s': %s", self._cache_file, str(err))
+            return
+        logger.debug("Saved %s histograms to cache '%s'", len(self._result), self._cache_file)
+
+    def _sort_filelist(self) -> None:
+        """ Collect the histograms, reading only those faces that are not in the input folder's
+        cache, then sort. If histogram caching has not been requested, every face is read. """
+        if self._cache_file is None:
+            super()._sort_filelist()
+            return
+        mtimes = {fname: os.path.getmtime(fname) for fname in self._iterator.file_list}
+        self._load_cache(mtimes)
+        num_cached = len(self._result)
+
+        for filename, image, alignments in self._iterator():
+            self.score_image(filename, image, alignments)
+
+        if num_cached and len(self._result) > num_cached:  # Restore file list order
+            order = {fname: idx for idx, fname in enumerate(self._iterator.file_list)}
+            self._result.sort(key=lambda r: order[r[0]])
+        if len(self._result) > num_cached:
+            self._save_cache(mtimes)
+
+        self.sort()
+        logger.debug("sorted list: %s", [r[0] for r in self._result])
 
     def _calc_histogram(self,
                         image: np.ndarray,
                         alignments: PNGHeaderAlignmentsDict | None) -> np.ndarray:
+        """ Calculate the 256 bin histogram of the first channel of the (masked) face.
+
+        The histogram is written directly into the next free row of :attr:`_histograms`.
+
+        Parameters
+        ----------
+        image: :class:`numpy.ndarray`
+            A face image loaded from disk
+        alignments: dict or ``None``
+            The alignments dictionary for the aligned face or ``None``
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The flat (256, ) float32 histogram, a view into :attr:`_histograms`
+        """
         if alignments:
             image = self._mask_face(image, alignments)
-        return cv2.calcHist([image], [0], None, [256], [0, 256])
+        row = self._next_histogram()
+        cv2.calcHist([image], [0], None, [256], [0, 256], hist=row.reshape(256, 1))
+        return row
 
-    def _sort_dissim(self) -> None:
-        """ Sort histograms by dissimilarity """
-        img_list_len = len(self._result)
-        for i in tqdm(range(0, img_list_len),
-                      desc="Comparing histograms",
-                      file=sys.stdout,
-                      leave=False):
-            score_total = 0
-            for j in range(0, img_list_len):
-                if i == j:
-                    continue
-                score_total += cv2.compareHist(self._result[i][1],
-                                               self._result[j][1],
-                                               cv2.HISTCMP_BHATTACHARYYA)
-            self._result[i][2] = score_total
+    def _get_histogram_roots(self) -> np.ndarray:
+        """ Obtain the square root of each collected histogram, normalized to sum to 1.
 
-        self._result = sorted(self._result, key=operator.itemgetter(2), reverse=True)
+        The Bhattacharyya coefficient between two of these histograms is their dot product, so
+        the distances for many pairs of histograms can be calculated with a single matrix
+        multiplication. This gives the same distance as :func:`cv2.compareHist` with
+        ``cv2.HISTCMP_BHATTACHARYYA``: ``sqrt(1 - coefficient)``
 
-    def _sort_sim(self) -> None:
-        """ Sort histograms by similarity """
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The (`N`, 256) float32 square rooted normalized histograms in the order of
+            :attr:`_result`
+        """
+        hists = np.stack([T.cast(np.ndarray, hist) for _, hist in self._result])
+        hists /= hists.sum(axis=1, keepdims=True)
+        return np.sqrt(hists, out=hists)
+
+    def _sort_dissim(self) -> None:
+        """ Sort histograms by dissimilarity """
+        roots = self._get_histogram_roots()
         img_list_len = len(self._result)
-        for i in tqdm(range(0, img_list_len - 1),
-                      desc="Comparing histograms",
-                      file=sys.stdout,
-                      leave=False):
-            min_score = float("inf")
-            j_min_score = i + 1
-            for j in range(i + 1, img_list_len):
-                score = cv2.compareHist(self._result[i][1],
-                                        self._result[j][1],
-                                        cv2.HISTCMP_BHATTACHARYYA)
-                if score < min_score:
-                    min_score = score
-                    j_min_score = j
-            (self._result[i + 1], self._result[j_min_score]) = (self._result[j_min_score],
-                                                                self._result[i + 1])
+        scores = np.empty((img_list_len, ), dtype="float32")
+        batch_size = max(1, min(img_list_len, self._block_size // img_list_len))
+        for start in tqdm(range(0, img_list_len, batch_size),
+                          desc="Comparing histograms",
+                          file=sys.stdout,
+                          leave=False):
+            end = min(start + batch_size, img_list_len)
+            dists = roots[start:end] @ roots.T
+            np.subtract(1.0, dists, out=dists)
+            np.sqrt(np.maximum(dists, 0.0, out=dists), out=dists)
+            dists[np.arange(end - start), np.arange(start, end)] = 0.0  # Exclude self comparison
+            scores[start:end] = dists.sum(axis=1)
+
+        self._result = [self._result[idx] for idx in np.argsort(-scores, kind="stable")]
 
     @classmethod
-    def _get_avg_score(cls, image: np.ndarray, references: list[np.ndarray]) -> float:
-        """ Return the average histogram score between a face and reference images
+    def _get_nearest(cls, roots: np.ndarray, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """ Find the most similar faces to each face.
+
+        The coefficients are calculated for blocks of rows at a time, so the full (`N`, `N`)
+        matrix is never held in memory.
 
         Parameters
         ----------
-        image: :class:`numpy.ndarray`
-            The image to test
-        references: list
-            List of reference images to test the original image against
+        roots: :class:`numpy.ndarray`
+            The (`N`, 256) square rooted normalized histograms
+        count: int
+            The number of most similar faces to find for each face
 
         Returns
         -------
-        float
-            The average score between the histograms
+        indices: :class:`numpy.ndarray`
+            The (`N`, `count`) indices of the most similar faces to each face, most similar first.
+            Equal coefficients are ordered by lowest index
+        coefficients: :class:`numpy.ndarray`
+            The (`N`, `count`) Bhattacharyya coefficients for each of the returned indices
         """
-        scores = []
-        for img2 in references:
-            score = cv2.compareHist(image, img2, cv2.HISTCMP_BHATTACHARYYA)
-            scores.append(score)
-        return sum(scores) / len(scores)
+        img_list_len = len(roots)
+        indices = np.empty((img_list_len, count), dtype="int64")
+        coefficients = np.empty((img_list_len, count), dtype=roots.dtype)
+        batch_size = max(1, min(img_list_len, cls._block_size // img_list_len))
+        for start in tqdm(range(0, img_list_len, batch_size),
+                          desc="Comparing histograms",
+                          file=sys.stdout,
+                          leave=False):
+            end = min(start + batch_size, img_list_len)
+            scores = roots[start:end] @ roots.T
+            scores[np.arange(end - start), np.arange(start, end)] = -np.inf  # Exclude self
+            idx = np.argpartition(scores, img_list_len - count, axis=1)[:, -count:]
+            coeffs = np.take_along_axis(scores, idx, axis=1)
+            order = np.lexsort((idx, -coeffs), axis=1)
+            indices[start:end] = np.take_along_axis(idx, order, axis=1)
+            coefficients[start:end] = np.take_along_axis(coeffs, order, axis=1)
+        return indices, coefficients
+
+    def _sort_sim(self) -> None:
+        """ Sort histograms by similarity.
+
+        Starting from the first image, the most similar of the remaining images is placed next.
+        The highest Bhattacharyya coefficient is the lowest distance, so the coefficients are
+        compared directly.
+
+        The nearest neighbours of every face are found up front with blocked matrix products.
+        The next face is the first unused neighbour of the current face, provided that it is
+        strictly more similar than the last neighbour found, as no face outside of the
+        neighbours can then be more similar. Otherwise all of the remaining faces are compared.
+        """
+        roots = self._get_histogram_roots()
+        img_list_len = len(self._result)
+        if img_list_len < 3:
+            return
+        count = min(img_list_len - 1, 32)
+        neighbours, coefficients = self._get_nearest(roots, count)
+        if count == img_list_len - 1:  # Every other face is a neighbour
+            coefficients[:, -1] = -np.inf
+
+        used = np.zeros((img_list_len, ), dtype="bool")
+        order = np.empty((img_list_len, ), dtype="int64")
+        current = order[0] = 0
+        used[current] = True
+        for i in tqdm(range(1, img_list_len),
+                      desc="Sorting",
+                      file=sys.stdout,
+                      leave=False):
+            free = np.flatnonzero(~used[neighbours[current]])
+            if free.size and coefficients[current, free[0]] > coefficients[current, -1]:
+                current = neighbours[current, free[0]]
+            else:
+                remaining = np.flatnonzero(~used)
+                current = remaining[(roots[remaining] @ roots[current]).argmax()]
+            used[current] = True
+            order[i] = current
+
+        self._result = [self._result[idx] for idx in order]
 
     def binning(self) -> list[list[str]]:
-        """ Group into bins by histogram """
+        """ Group into bins by histogram.
+
+        Each face joins the existing group with the lowest average Bhattacharyya distance to the
+        faces already in it, or starts a new group if that distance is not below the threshold.
+        Every face becomes a member of a group, so the distances to all previous faces are
+        calculated with one matrix-vector product and averaged per group. """
         msg = "dissimilarity" if self._is_dissim else "similarity"
         logger.info("Grouping by %s...", msg)
 
-        # Groups are of the form: group_num -> reference histogram
-        reference_groups: dict[int, list[np.ndarray]] = {}
-
         # Bins array, where index is the group number and value is
         # an array containing the file paths to the images in that group
-        bins: list[list[str]] = []
+        bins: list[list[str]] = [[self._result[0][0]]]
 
         threshold = self._threshold
-
+        roots = self._get_histogram_roots()
         img_list_len = len(self._result)
-        reference_groups[0] = [T.cast(np.ndarray, self._result[0][1])]
-        bins.append([self._result[0][0]])
+        labels = np.zeros((img_list_len, ), dtype="int64")  # The group each face belongs to
+        group_counts = [1]
 
         for i in tqdm(range(1, img_list_len),
                       desc="Grouping",
                       file=sys.stdout,
                       leave=False):
-            current_key = -1
-            current_score = float("inf")
-            for key, value in reference_groups.items():
-                score = self._get_avg_score(self._result[i][1], value)
-                if score < current_score:
-                    current_key, current_score = key, score
-
-            if current_score < threshold:
-                reference_groups[T.cast(int, current_key)].append(self._result[i][1])
+            dists = roots[:i] @ roots[i]
+            np.subtract(1.0, dists, out=dists)
+            np.sqrt(np.maximum(dists, 0.0, out=dists), out=dists)
+            scores = np.bincount(labels[:i], weights=dists, minlength=len(bins)) / group_counts
+            current_key = int(scores.argmin())
+
+            if scores[current_key] < threshold:
+                labels[i] = current_key
+                group_counts[current_key] += 1
                 bins[current_key].append(self._result[i][0])
             else:
-                reference_groups[len(reference_groups)] = [self._result[i][1]]
+                labels[i] = len(bins)
+                group_counts.append(1)
                 bins.append([self._result[i][0]])
 
         return bins